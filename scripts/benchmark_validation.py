@@ -0,0 +1,45 @@
+"""
+Times the NumPy fast-path validation checks against the pandera schemas.
+
+Usage:
+    python benchmark_validation.py <input_path> [--rows <n>] [--repeat <n>]
+"""
+import sys
+import os
+import timeit
+import click
+import numpy as np
+import pandas as pd
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.data_validation import (
+    fast_validate_data_types, fast_validate_missing_values, fast_validate_duplicates,
+    DATA_TYPES_SCHEMA, MISSING_VALUES_SCHEMA, DUPLICATE_SCHEMA
+)
+
+
+@click.command()
+@click.argument('input_path', type=click.Path(exists=True))
+@click.option('--rows', type=int, default=None, help="Tile the data up to this many rows.")
+@click.option('--repeat', type=int, default=20, help="Timed runs per check.")
+def main(input_path, rows, repeat):
+    df = pd.read_csv(input_path)
+    if rows:
+        df = pd.concat([df] * -(-rows // len(df)), ignore_index=True).iloc[:rows]
+        # Keep rows distinct so the duplicate check does a full pass
+        df["Extent"] = df["Extent"] + np.arange(len(df)) * 1e-9
+    click.echo(f"{len(df)} rows, best of {repeat} runs")
+
+    checks = [
+        ("data types", fast_validate_data_types, DATA_TYPES_SCHEMA),
+        ("missing values", fast_validate_missing_values, MISSING_VALUES_SCHEMA),
+        ("duplicates", fast_validate_duplicates, DUPLICATE_SCHEMA),
+    ]
+    click.echo(f"{'check':<16}{'numpy (ms)':>12}{'pandera (ms)':>14}{'speedup':>10}")
+    for name, fast, schema in checks:
+        fast_ms = min(timeit.repeat(lambda: fast(df), number=1, repeat=repeat)) * 1000
+        pandera_ms = min(timeit.repeat(lambda: schema.validate(df), number=1, repeat=repeat)) * 1000
+        click.echo(f"{name:<16}{fast_ms:>12.3f}{pandera_ms:>14.3f}{pandera_ms / fast_ms:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Builds a reference sketch from training data and checks new batches for drift.
+
+The sc2 training file holds scaled features, so pass the preprocessor saved
+with it to reference; the sketch records it, and check then refuses to
+compare raw batches unless they are scaled with the same --preprocessor.
+
+Usage:
+    python monitor_drift.py reference <train_data_path> <sketch_path> [--bins <n>] [--preprocessor <path>]
+    python monitor_drift.py check <sketch_path> <batch_path>... [--preprocessor <path>] [--output <csv>]
+"""
+import sys
+import os
+import click
+import pandas as pd
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.data_cleaning import load_preprocessor, apply_preprocessor
+from src.drift_monitoring import fit_reference, summarize, merge_sketches, drift_report, save_sketch, load_sketch
+
+
+@click.group()
+def main():
+    """Data drift monitoring against the training data."""
+
+
+@main.command()
+@click.argument("train_data_path", type=click.Path(exists=True))
+@click.argument("sketch_path", type=click.Path())
+@click.option("--bins", type=int, default=10, help="Quantile bins per feature.")
+@click.option("--preprocessor", "preprocessor_path", type=click.Path(exists=True), default=None,
+              help="The sc2 preprocessor that scaled the training data; omit for raw training data.")
+def reference(train_data_path, sketch_path, bins, preprocessor_path):
+    """Sketch the training data once and save it as the reference."""
+    preprocessor_hash = None
+    if preprocessor_path:
+        try:
+            preprocessor_hash = load_preprocessor(preprocessor_path, train_data_path)["data_hash"]
+        except ValueError as err:
+            raise click.ClickException(str(err))
+    sketch = fit_reference(pd.read_csv(train_data_path), n_bins=bins, preprocessor_hash=preprocessor_hash)
+    save_sketch(sketch, sketch_path)
+    click.echo(f"Reference sketch saved to {sketch_path}")
+
+
+@main.command()
+@click.argument("sketch_path", type=click.Path(exists=True))
+@click.argument("batch_paths", type=click.Path(exists=True), nargs=-1, required=True)
+@click.option("--preprocessor", "preprocessor_path", type=click.Path(exists=True), default=None,
+              help="Scale raw batches with the sc2 preprocessor before comparing.")
+@click.option("--chunksize", type=int, default=100_000, help="Rows read per chunk.")
+@click.option("--psi-threshold", type=float, default=0.2, help="PSI above which a feature is flagged.")
+@click.option("--output", type=click.Path(), default=None, help="Write the drift report to this CSV.")
+def check(sketch_path, batch_paths, preprocessor_path, chunksize, psi_threshold, output):
+    """Compare new batches with the reference sketch."""
+    ref = load_sketch(sketch_path)
+    preprocessor = load_preprocessor(preprocessor_path) if preprocessor_path else None
+    # Bins of scaled training data say nothing about raw batches, or vice versa
+    expected = ref.get("preprocessor_hash")
+    if expected is None and preprocessor is not None:
+        raise click.ClickException("The reference sketch holds raw features; drop --preprocessor")
+    if expected is not None and preprocessor is None:
+        raise click.ClickException("The reference sketch holds scaled features; pass the sc2 --preprocessor")
+    if expected is not None and preprocessor["data_hash"] != expected:
+        raise click.ClickException(f"{preprocessor_path} is not the preprocessor the reference was scaled with")
+
+    sketches = []
+    for path in batch_paths:
+        for chunk in pd.read_csv(path, chunksize=chunksize):
+            if preprocessor is not None:
+                chunk[preprocessor['features']] = apply_preprocessor(preprocessor, chunk)
+            sketches.append(summarize(chunk, ref["edges"]))
+    report = drift_report(ref, merge_sketches(*sketches))
+
+    if output:
+        report.to_csv(output, index=False)
+        click.echo(f"Drift report saved to {output}")
+    drifted = report[report["psi"] > psi_threshold]
+    if drifted.empty:
+        click.echo("No drift detected.")
+    else:
+        click.echo(f"Drift detected (PSI > {psi_threshold}):")
+        click.echo(drifted.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
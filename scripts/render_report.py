@@ -0,0 +1,88 @@
+"""
+Renders the Quarto analysis report to several formats in parallel.
+
+Executed code cells are cached (execute: cache: true in the report). The cache
+is keyed on a hash of every file under the results directory: when that hash
+changes every format is rendered in parallel with --cache-refresh, since
+quarto's cache key includes each format's own setup cells and a refresh for
+one format leaves the others stale. The stamp is written only once all of
+them succeed, so a failed build re-executes next time. When only prose
+changes, all formats render in parallel without executing any code.
+
+Each format renders from its own copy of the report, <stem>.render-<format>.qmd,
+next to the original. Quarto names its intermediate notebook and <stem>_files/
+directory after the input, so the concurrent renders never share or clean up
+each other's files. Relative paths and the output-file in the front matter
+are unchanged, so the outputs land where a plain quarto render puts them.
+
+Usage:
+    python render_report.py <qmd_path> [--results-dir <dir>] [--formats html,pdf]
+"""
+import sys
+import os
+import shutil
+import subprocess
+import time
+import click
+from pathlib import Path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.data_cleaning import path_hash
+
+
+def scratch_copy(qmd_path, fmt) -> Path:
+    """Path of the per-format copy of the report that quarto renders."""
+    qmd_path = Path(qmd_path)
+    return qmd_path.with_name(f"{qmd_path.stem}.render-{fmt}{qmd_path.suffix}")
+
+
+def render(qmd_path, formats, cache_refresh=False):
+    """Run one quarto render per format concurrently, each on its own copy, and fail if any fails."""
+    start = time.perf_counter()
+    processes = []
+    try:
+        for fmt in formats:
+            copy_path = scratch_copy(qmd_path, fmt)
+            shutil.copyfile(qmd_path, copy_path)
+            command = ["quarto", "render", str(copy_path), "--to", fmt]
+            if cache_refresh:
+                command.append("--cache-refresh")
+            click.echo(" ".join(command))
+            processes.append((fmt, subprocess.Popen(command)))
+        failed = [fmt for fmt, process in processes if process.wait() != 0]
+    finally:
+        for process in (p for _, p in processes):
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+        for fmt in formats:
+            scratch_copy(qmd_path, fmt).unlink(missing_ok=True)
+    if failed:
+        raise click.ClickException(f"quarto render failed for: {', '.join(failed)}")
+    click.echo(f"Rendered {', '.join(formats)} in {time.perf_counter() - start:.2f}s")
+
+
+@click.command()
+@click.argument("qmd_path", type=click.Path(exists=True))
+@click.option("--results-dir", type=click.Path(exists=True), default="results",
+              help="Directory of precomputed tables and figures read by the report.")
+@click.option("--formats", type=str, default="html,pdf", help="Comma-separated output formats.")
+def main(qmd_path, results_dir, formats):
+    started = time.perf_counter()
+    formats = [fmt.strip() for fmt in formats.split(",") if fmt.strip()]
+    stamp_path = Path(qmd_path).with_name(f".{Path(qmd_path).stem}.results.sha256")
+
+    current = path_hash(results_dir)
+    previous = stamp_path.read_text().strip() if stamp_path.exists() else None
+
+    if current != previous:
+        click.echo("Results changed; re-executing report code...")
+        render(qmd_path, formats, cache_refresh=True)
+        stamp_path.write_text(current)
+    else:
+        click.echo("Results unchanged; using cached report code output.")
+        render(qmd_path, formats)
+    click.echo(f"Report rendered in {time.perf_counter() - started:.2f}s.")
+
+
+if __name__ == "__main__":
+    main()
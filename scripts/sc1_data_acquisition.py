@@ -1,18 +1,28 @@
 """
 Downloads data from URL or reads from local path and saves it locally. 
+With --partitioned-dir, the data is also added to a dataset partitioned by
+ingestion date and Class.
 
 Usage:
-    python s1_data_acquisition.py <input_path_or_url> <output_path>
+    python s1_data_acquisition.py <input_path_or_url> <output_path> [--partitioned-dir <dir>] [--ingest-date <YYYY-MM-DD>]
 """
+import sys
+import os
 import click
 import pandas as pd
 import requests
+from datetime import date
 from pathlib import Path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.partitioning import write_partitioned
 
 @click.command()
 @click.argument("input_path", type=str)
 @click.argument("output_path", type=click.Path())
-def main(input_path, output_path):
+@click.option("--partitioned-dir", type=click.Path(), default=None,
+              help="Also write the data under this partitioned dataset directory.")
+@click.option("--ingest-date", type=str, default=None, help="Ingestion date partition (default: today).")
+def main(input_path, output_path, partitioned_dir, ingest_date):
     # Check if input is a URL
     if input_path.startswith('http://') or input_path.startswith('https://'):
         click.echo(f"Downloading data from {input_path}...")
@@ -38,5 +48,11 @@ def main(input_path, output_path):
         df.to_csv(output_path, index=False)
         click.echo(f"Data copied to {output_path}")
 
+    if partitioned_dir:
+        ingest_date = ingest_date or date.today().isoformat()
+        manifest = write_partitioned(pd.read_csv(output_path), partitioned_dir, ingest_date)
+        click.echo(f"Data partitioned under {partitioned_dir} "
+                   f"({len(manifest['partitions'])} partitions)")
+
 if __name__ == "__main__":
     main()
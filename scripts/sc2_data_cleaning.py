@@ -1,41 +1,93 @@
 """
-Cleans and processes raw data and outputs train/test CSV files.
+Cleans and processes raw data and outputs train/test CSV files, plus the
+fitted scaler as <output_path stem>_preprocessor.pkl for model fitting and scoring.
+With --tables-dir, summary tables of the raw features are also saved for the report.
+
+input_path may be a partitioned dataset directory written by sc1; --filter
+expressions (e.g. "ingest_date>=2024-01-01", "Class==Kecimen", "Area<90000")
+then prune partitions before any rows are read. With --partitioned, train and
+test are written as partitioned directories <output_path stem>_train/ and _test/.
+Their features are scaled, so they only accept partition key filters.
 
 Usage:
-    python s2_data_cleanning.py <input_path> <output_path>
+    python s2_data_cleanning.py <input_path> <output_path> [--tables-dir <dir>] [--filter <expr>]... [--partitioned]
 """
 
 import sys
 import os
+import shutil
 import click
 import pandas as pd
-from sklearn.model_selection import train_test_split
+from pathlib import Path
+from datetime import date
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from src.data_cleaning import clean_data, scale_features
+from src.data_cleaning import clean_data, split_data, fit_scaler, scale_features, path_hash, save_preprocessor
+from src.data_validation import EXPECTED_COLS
+from src.partitioning import read_partitioned, write_partitioned
 
 
 @click.command()
 @click.argument("input_path", type=click.Path(exists=True))
 @click.argument("output_path", type=click.Path())
-def main(input_path, output_path):
+@click.option("--tables-dir", type=click.Path(), default=None,
+              help="Directory for the raw feature summary tables used by the report.")
+@click.option("--filter", "filters", type=str, multiple=True,
+              help="Row filter on a partitioned input, e.g. 'ingest_date>=2024-01-01'.")
+@click.option("--partitioned", is_flag=True, help="Write train and test as partitioned directories.")
+def main(input_path, output_path, tables_dir, filters, partitioned):
     # 1. Read data
-    df = pd.read_csv(input_path)
+    if os.path.isdir(input_path):
+        df = read_partitioned(input_path, filters, columns=EXPECTED_COLS + ["ingest_date"])
+        dates = df.pop("ingest_date")
+    elif filters:
+        raise click.UsageError("--filter needs a partitioned input directory.")
+    else:
+        df = pd.read_csv(input_path)
+        dates = pd.Series(date.today().isoformat(), index=df.index)
+    click.echo(f"Read {len(df)} rows from {input_path}")
+
+    if tables_dir:
+        Path(tables_dir).mkdir(parents=True, exist_ok=True)
+        X = df.drop(columns=["Unnamed: 0", "Class"], errors="ignore")
+        pd.DataFrame({
+            "Column": X.columns,
+            "Non-Null Count": X.notnull().sum().values,
+            "Dtype": X.dtypes.astype(str).values
+        }).to_csv(os.path.join(tables_dir, "data_info.csv"), index=False)
+        X.describe().to_csv(os.path.join(tables_dir, "data_describe.csv"))
+        click.echo(f"Summary tables saved to {tables_dir}")
 
     # 2. Clean data
     df = clean_data(df)
 
     # 3. Split data
-    train, test = train_test_split(df, test_size=0.2, random_state=123)
+    train, test = split_data(df, test_size=0.2, random_state=123)
 
-    # 4. Scale features
-    train_scaled, test_scaled = scale_features(train, test)
+    # 4. Scale features (fit once on the raw training features)
+    scaler = fit_scaler(train)
+    train_scaled, test_scaled = scale_features(train, test, scaler=scaler)
 
     # 5. Save outputs
-    train_scaled.to_csv(output_path.replace(".csv", "_train.csv"), index=False)
-    test_scaled.to_csv(output_path.replace(".csv", "_test.csv"), index=False)
+    if partitioned:
+        train_path = output_path.replace(".csv", "_train")
+        test_path = output_path.replace(".csv", "_test")
+        for path, scaled in ((train_path, train_scaled), (test_path, test_scaled)):
+            # Start clean so partitions from earlier runs are not mixed in
+            shutil.rmtree(path, ignore_errors=True)
+            write_partitioned(scaled.assign(ingest_date=dates.loc[scaled.index]), path, scaled=True)
+    else:
+        train_path = output_path.replace(".csv", "_train.csv")
+        train_scaled.to_csv(train_path, index=False)
+        test_scaled.to_csv(output_path.replace(".csv", "_test.csv"), index=False)
 
     click.echo("Processed train and test files saved.")
 
+    # 6. Save the fitted scaler, tied to the training file it produced
+    preprocessor_path = output_path.replace(".csv", "_preprocessor.pkl")
+    save_preprocessor(scaler, preprocessor_path, path_hash(train_path))
+
+    click.echo(f"Preprocessor saved to {preprocessor_path}")
+
 
 if __name__ == "__main__":
     main()
@@ -3,17 +3,60 @@ Validates data used for subsequent scripts.
 
 Usage:
     python s3_data_validation.py <input_path>
+    python s3_data_validation.py --glob "<pattern>" [--n-jobs <n>] [--report <json_path>]
+    python s3_data_validation.py --manifest <file_list> [--n-jobs <n>] [--report <json_path>]
+
+With --glob or --manifest (one path per line), the files are validated in
+parallel and the per-file results are merged into one report.
 """
 import sys
 import os
+import glob
+import json
 import pandas as pd
 import click
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from src.data_validation import validate_file_format, validate_columns, validate_data_types, validate_missing_values, validate_duplicates, validate_high_correlation, validate_target_correlation
+from src.sharded_validation import validate_files
+
+
+def validate_many(input_paths: list, n_jobs: int, report_path: str) -> None:
+    """Validate several files in a worker pool and print the aggregated report."""
+    click.echo(f"Validating {len(input_paths)} files...")
+    report = validate_files(input_paths, n_jobs=n_jobs)
+    for result in report["files"]:
+        if not result["passed"]:
+            click.echo(f"Error: {result['path']} failed: {', '.join(result['failures'])}")
+    click.echo(f"{len(input_paths) - report['files_failed']}/{len(input_paths)} files passed "
+               f"({report['rows']} rows).")
+    click.echo(f"Rows duplicated across files: {report['cross_file_duplicates']}")
+    print(f"High correlation features: {report['high_correlation']}")
+    print(f"Target correlation features: {report['target_correlation']}")
+    if report_path:
+        with open(report_path, 'w') as f:
+            json.dump(report, f, indent=2)
+        click.echo(f"Validation report saved to {report_path}")
+
 
 @click.command()
-@click.argument('input_path', type=click.Path(exists=True))
-def main(input_path: str) -> None:
+@click.argument('input_path', type=click.Path(exists=True), required=False)
+@click.option('--glob', 'pattern', type=str, default=None, help="Validate every file matching this pattern.")
+@click.option('--manifest', type=click.Path(exists=True), default=None, help="File listing one input path per line.")
+@click.option('--n-jobs', type=int, default=None, help="Worker processes for multi-file validation.")
+@click.option('--report', 'report_path', type=click.Path(), default=None, help="Save the aggregated report as JSON.")
+def main(input_path: str, pattern: str, manifest: str, n_jobs: int, report_path: str) -> None:
+    if pattern or manifest:
+        input_paths = sorted(glob.glob(pattern, recursive=True)) if pattern else []
+        if manifest:
+            with open(manifest) as f:
+                input_paths += [line.strip() for line in f if line.strip()]
+        if not input_paths:
+            raise click.UsageError("No input files found.")
+        validate_many(input_paths, n_jobs, report_path)
+        return
+    if input_path is None:
+        raise click.UsageError("Give INPUT_PATH, --glob or --manifest.")
+
     click.echo("Starting data validation...")
     #1. Validate file format
     if not validate_file_format(input_path):
@@ -30,21 +73,25 @@ def main(input_path: str) -> None:
         click.echo("Column validation passed.")
         
     #3. Validate data types
-    if not validate_data_types(pd.read_csv(input_path)):
+    errors = []
+    if not validate_data_types(pd.read_csv(input_path), errors=errors):
         click.echo("Error: The dataset has incorrect data types.")
+        click.echo("\n".join(errors))
         return
     else:
         click.echo("Data type validation passed.")
     
     #4. Validate missing values
-    if not validate_missing_values(pd.read_csv(input_path)):
+    if not validate_missing_values(pd.read_csv(input_path), errors=errors):
         click.echo("Error: The dataset has too many missing values.")
+        click.echo("\n".join(errors))
         return
     else:
         click.echo("Missing value validation passed.")
     #5. Validate duplicates
-    if not validate_duplicates(pd.read_csv(input_path)):
+    if not validate_duplicates(pd.read_csv(input_path), errors=errors):
         click.echo("Error: The dataset contains duplicate rows.")
+        click.echo("\n".join(errors))
         return
     else:
         click.echo("Duplicate row validation passed.")
@@ -2,9 +2,25 @@
 Fit a logistic regression model and generate model evaluation artifacts.
 
 Usage:
-    python s5_model_fitting.py <train_data_path> <test_data_path> <output_prefix>
+    python s5_model_fitting.py <train_data_path> <test_data_path> <output_prefix> [--preprocessor <path>]
+        [--compare <name,name,...> [--latency-budget-ms <ms>] [--n-jobs <n>]] [--filter <expr>]...
+        [--importance coefficient|permutation [--n-repeats <n>]]
+
+With --compare, the listed estimators are trained in parallel, recorded in
+<output_prefix>_registry.json, and the most accurate one within the latency
+budget is saved and evaluated instead of the logistic regression.
+
+The train and test data may be partitioned directories written by
+sc2 --partitioned; --filter expressions then select e.g. a recent training
+window, pruning partitions and columns before any rows are read. Their features
+are already scaled, so only partition keys (ingest_date, Class) can be filtered.
+
+With --importance permutation, feature importance is the test accuracy drop
+when each feature is shuffled, computed in parallel over --n-repeats shuffles.
 """
 
+import sys
+import os
 import click
 import numpy as np
 import pandas as pd
@@ -14,6 +30,24 @@ from sklearn.linear_model import LogisticRegression
 from sklearn.preprocessing import StandardScaler
 from sklearn. metrics import ConfusionMatrixDisplay, classification_report, accuracy_score
 import pickle
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.data_cleaning import load_preprocessor
+from src.data_validation import EXPECTED_COLS
+from src.partitioning import read_partitioned
+from src.model_comparison import ESTIMATORS, compare_estimators, select_winner, update_registry
+from src.feature_importance import permutation_importance
+
+
+def read_data(path, filters):
+    """Read a CSV file, or the filtered rows of a partitioned dataset directory."""
+    if os.path.isdir(path):
+        try:
+            return read_partitioned(path, filters, columns=EXPECTED_COLS)
+        except ValueError as err:
+            raise click.UsageError(str(err))
+    if filters:
+        raise click.UsageError("--filter needs partitioned input directories.")
+    return pd.read_csv(path)
 
 
 def fit_model(X_train, y_train):
@@ -40,7 +74,7 @@ def save_confusion_matrix(clf, X_test, y_test, output_prefix):
     print(f"Confusion matrix saved to {output_prefix}_confusion_matrix.png")
 
 
-def save_classification_report(clf, X_test, y_test, output_prefix):
+def save_classification_report(clf, X_test, y_test, output_prefix, model_name="Logistic Regression"):
     """Generate and save classification metrics table."""
     y_test = np.array(y_test)
     y_pred = clf.predict(X_test)
@@ -56,7 +90,7 @@ def save_classification_report(clf, X_test, y_test, output_prefix):
     accuracy = accuracy_score(y_test, y_pred)
     
     with open(f"{output_prefix}_model_summary.txt", 'w') as f:
-        f.write(f"Model: Logistic Regression\n")
+        f.write(f"Model: {model_name}\n")
         f.write(f"Accuracy: {accuracy:.4f}\n\n")
         f.write("Classification Report:\n")
         f.write(classification_report(y_test, y_pred))
@@ -98,11 +132,46 @@ def save_feature_importance(clf, feature_names, output_prefix):
     print(f"Feature importance saved to {output_prefix}_feature_importance.[csv|png]")
 
 
+def save_permutation_importance(clf, X_test, y_test, feature_names, output_prefix, n_repeats=10, n_jobs=None):
+    """Generate and save permutation feature importance with standard deviations."""
+    importance_df = permutation_importance(clf, X_test, y_test, feature_names,
+                                           n_repeats=n_repeats, n_jobs=n_jobs)
+    
+    # Save as CSV
+    importance_df.to_csv(f"{output_prefix}_feature_importance.csv", index=False)
+    
+    # Create visualization
+    plt.figure(figsize=(10, 6))
+    top_features = importance_df.head(15).iloc[::-1]
+    plt.barh(top_features['feature'], top_features['importance'], xerr=top_features['std'])
+    plt.xlabel('Mean Accuracy Decrease')
+    plt.title(f'Top 15 Feature Importances (Permutation, {n_repeats} repeats)')
+    plt.tight_layout()
+    plt.savefig(f"{output_prefix}_feature_importance.png", dpi=300, bbox_inches='tight')
+    plt.close()
+    
+    print(f"Feature importance saved to {output_prefix}_feature_importance.[csv|png]")
+
+
 @click.command()
 @click. argument("train_data_path", type=click.Path(exists=True))
 @click.argument("test_data_path", type=click.Path(exists=True))
 @click.argument("output_prefix", type=str)
-def main(train_data_path, test_data_path, output_prefix):
+@click.option("--preprocessor", "preprocessor_path", type=click.Path(exists=True), default=None,
+              help="Scaler saved by sc2_data_cleaning.py; the data is then used as already scaled.")
+@click.option("--compare", type=str, default=None,
+              help=f"Comma-separated estimators to compare: {', '.join(ESTIMATORS)}.")
+@click.option("--latency-budget-ms", type=float, default=None,
+              help="Maximum predict time per 1k rows for the compared winner.")
+@click.option("--n-jobs", type=int, default=None,
+              help="Worker processes for --compare and permutation importance.")
+@click.option("--filter", "filters", type=str, multiple=True,
+              help="Row filter on partitioned inputs, e.g. 'ingest_date>=2024-01-01'.")
+@click.option("--importance", type=click.Choice(["coefficient", "permutation"]), default="coefficient",
+              help="Rank features by model coefficients or by permutation importance.")
+@click.option("--n-repeats", type=int, default=10, help="Shuffles per feature for permutation importance.")
+def main(train_data_path, test_data_path, output_prefix, preprocessor_path, compare, latency_budget_ms, n_jobs, filters,
+         importance, n_repeats):
     """
     Train a logistic regression model and generate evaluation artifacts.
     
@@ -123,8 +192,8 @@ def main(train_data_path, test_data_path, output_prefix):
     # 1.  LOAD DATA
     # -----------------------------
     click.echo(f"\n1. Loading data...")
-    train_df = pd.read_csv(train_data_path)
-    test_df = pd.read_csv(test_data_path)
+    train_df = read_data(train_data_path, filters)
+    test_df = read_data(test_data_path, filters)
     
     click.echo(f"   Training set: {len(train_df)} rows")
     click.echo(f"   Test set: {len(test_df)} rows")
@@ -138,24 +207,52 @@ def main(train_data_path, test_data_path, output_prefix):
     # -----------------------------
     # 2.  SCALE FEATURES
     # -----------------------------
-    click.echo(f"\n2. Scaling features...")
-    scaler = StandardScaler()
-    X_train_scaled = scaler.fit_transform(X_train)
-    X_test_scaled = scaler.transform(X_test)
+    if preprocessor_path:
+        # sc2 already scaled the data; reuse its scaler instead of refitting
+        click.echo(f"\n2. Loading preprocessor from {preprocessor_path}...")
+        preprocessor = load_preprocessor(preprocessor_path, data_path=train_data_path)
+        scaler = preprocessor['scaler']
+        X_train_scaled = X_train[preprocessor['features']].to_numpy()
+        X_test_scaled = X_test[preprocessor['features']].to_numpy()
+        # The sc2 scaler takes raw measurements
+        scaler_input = 'raw'
+    else:
+        click.echo(f"\n2. Scaling features...")
+        scaler = StandardScaler()
+        X_train_scaled = scaler.fit_transform(X_train)
+        X_test_scaled = scaler.transform(X_test)
+        # This scaler takes whatever the training CSV holds, e.g. data sc2 already scaled
+        scaler_input = 'train_data'
     
     # -----------------------------
     # 3. TRAIN MODEL
     # -----------------------------
-    click.echo(f"\n3. Training logistic regression model...")
-    clf = fit_model(X_train_scaled, y_train)
-    click.echo(f"Model training complete")
+    if compare:
+        names = [name.strip() for name in compare.split(',') if name.strip()]
+        click.echo(f"\n3. Comparing {len(names)} models...")
+        results = compare_estimators(X_train_scaled, y_train, X_test_scaled, y_test, names, n_jobs=n_jobs)
+        winner = select_winner(results, latency_budget_ms)
+        update_registry(f"{output_prefix}_registry.json", results, winner, latency_budget_ms)
+        for r in results:
+            click.echo(f"   {r['estimator']}: accuracy {r['accuracy']:.4f}, "
+                       f"fit {r['fit_seconds']:.3f}s, predict {r['predict_ms_per_1k']:.3f} ms/1k rows, "
+                       f"{r['model_size_bytes']} bytes")
+        click.echo(f"Selected {winner['estimator']}; registry saved to {output_prefix}_registry.json")
+        clf = winner['model']
+        model_name = winner['estimator']
+    else:
+        click.echo(f"\n3. Training logistic regression model...")
+        clf = fit_model(X_train_scaled, y_train)
+        model_name = "Logistic Regression"
+        click.echo(f"Model training complete")
     
     # -----------------------------
     # 4. SAVE MODEL
     # -----------------------------
     model_path = f"{output_prefix}_model.pkl"
     with open(model_path, 'wb') as f:
-        pickle.dump({'model': clf, 'scaler': scaler}, f)
+        pickle.dump({'model': clf, 'scaler': scaler, 'features': X_train.columns.tolist(),
+                     'scaler_input': scaler_input}, f)
     click.echo(f"Model saved to {model_path}")
     
     # -----------------------------
@@ -164,8 +261,14 @@ def main(train_data_path, test_data_path, output_prefix):
     click.echo(f"\n4. Generating evaluation artifacts...")
     
     save_confusion_matrix(clf, X_test_scaled, y_test, output_prefix)
-    save_classification_report(clf, X_test_scaled, y_test, output_prefix)
-    save_feature_importance(clf, X_train. columns. tolist(), output_prefix)
+    save_classification_report(clf, X_test_scaled, y_test, output_prefix, model_name)
+    if importance == 'permutation':
+        save_permutation_importance(clf, X_test_scaled, y_test, X_train.columns.tolist(), output_prefix,
+                                    n_repeats=n_repeats, n_jobs=n_jobs)
+    elif hasattr(clf, 'coef_'):
+        save_feature_importance(clf, X_train. columns. tolist(), output_prefix)
+    else:
+        click.echo(f"{model_name} has no coefficients; feature importance skipped")
     
     click.echo("\n" + "=" * 60)
     click.echo("MODEL EVALUATION COMPLETE")
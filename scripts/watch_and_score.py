@@ -0,0 +1,60 @@
+"""
+Watches a directory for new raisin measurement CSVs and scores them with the
+model saved by sc5_model_fitting.py.
+
+Each file is cleaned, validated and scored, and its predictions are written to
+<output_dir>/<name>_predictions.csv. Processed files are recorded in
+<output_dir>/ledger.jsonl, so a restart only scores files it has not finished.
+
+Usage:
+    python watch_and_score.py <input_dir> <model_path> <output_dir> [--queue-size <n>] [--workers <n>]
+        [--poll-interval <s>] [--settle-seconds <s>] [--once]
+"""
+import sys
+import os
+import click
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from src.scoring import load_model, watch, latency_summary
+
+
+def echo_record(record: dict) -> None:
+    if record["status"] == "scored":
+        click.echo(f"Scored {record['rows']} rows from {record['file']} "
+                   f"in {record['latency_seconds']:.3f}s after landing")
+    else:
+        click.echo(f"Error: {record['file']} failed: {record['error']}")
+
+
+@click.command()
+@click.argument("input_dir", type=click.Path(exists=True, file_okay=False))
+@click.argument("model_path", type=click.Path(exists=True))
+@click.argument("output_dir", type=click.Path())
+@click.option("--queue-size", type=int, default=8, help="Files waiting to be scored before the watcher blocks.")
+@click.option("--workers", type=int, default=1, help="Scoring threads sharing the loaded model.")
+@click.option("--poll-interval", type=float, default=1.0, help="Seconds between directory scans.")
+@click.option("--settle-seconds", type=float, default=1.0, help="Seconds a file must be unmodified before it is read.")
+@click.option("--once", is_flag=True, help="Score the files present now and exit.")
+def main(input_dir, model_path, output_dir, queue_size, workers, poll_interval, settle_seconds, once):
+    try:
+        bundle = load_model(model_path)
+    except ValueError as err:
+        raise click.ClickException(str(err))
+    click.echo(f"Model loaded from {model_path}; watching {input_dir}...")
+
+    records = watch(
+        input_dir, output_dir, bundle, os.path.join(output_dir, "ledger.jsonl"),
+        queue_size=queue_size, workers=workers, poll_interval=poll_interval,
+        settle_seconds=settle_seconds, once=once, on_record=echo_record,
+    )
+
+    summary = latency_summary(records)
+    if summary["files"]:
+        click.echo(f"Scored {summary['files']} files; landing-to-prediction latency "
+                   f"mean {summary['mean_seconds']:.3f}s, p50 {summary['p50_seconds']:.3f}s, "
+                   f"p95 {summary['p95_seconds']:.3f}s, max {summary['max_seconds']:.3f}s")
+    else:
+        click.echo("No files scored.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,7 @@
+import hashlib
+import os
+import pickle
+
 import pandas as pd
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler
@@ -9,7 +13,7 @@ def clean_data(df: pd.DataFrame) -> pd.DataFrame:
     """
     if df is None or df.empty:
         raise ValueError("Input DataFrame is empty or None")
-    if df.type != pd.DataFrame:
+    if not isinstance(df, pd.DataFrame):
         raise TypeError("Input is not a pandas DataFrame")
     df = df.drop_duplicates()
     df = df.dropna()
@@ -20,14 +24,37 @@ def clean_data(df: pd.DataFrame) -> pd.DataFrame:
     df = df.copy()
     df["Area"] = df["Area"].astype(float)
     df["ConvexArea"] = df["ConvexArea"].astype(float)
-    df["Class"] = df["Class"].astype(str)
+    if "Class" in df.columns:
+        df["Class"] = df["Class"].astype(str)
 
     return df
 
 
-def scale_features(train_df, test_df, target_col="Class"):
+def split_data(df: pd.DataFrame, test_size=0.2, random_state=123):
+    """
+    Split the cleaned dataset into train and test sets.
+    """
+    return train_test_split(df, test_size=test_size, random_state=random_state)
+
+
+def fit_scaler(train_df, target_col="Class"):
+    """
+    Fit a StandardScaler on all features except the target column.
+    """
+    if train_df is None or train_df.empty:
+        raise ValueError("Input DataFrame is empty or None")
+    if target_col not in train_df.columns:
+        raise ValueError(f"Target column '{target_col}' not found in DataFrame")
+    features = train_df.columns.drop(target_col)
+    return StandardScaler().fit(train_df[features])
+
+
+def scale_features(train_df, test_df, target_col="Class", scaler=None):
     """
     Scale all features except the target column.
+
+    If a fitted scaler is given it is only applied, otherwise one is fitted
+    on the training data.
     """
     if train_df is None or test_df is None:
         raise ValueError("Input DataFrames cannot be None")
@@ -35,14 +62,83 @@ def scale_features(train_df, test_df, target_col="Class"):
         raise ValueError("Input DataFrames cannot be empty")
     if target_col not in train_df.columns or target_col not in test_df.columns:
         raise ValueError(f"Target column '{target_col}' not found in DataFrames")
-    scaler = StandardScaler()
+    if scaler is None:
+        scaler = fit_scaler(train_df, target_col)
 
     features = train_df.columns.drop(target_col)
 
     train_scaled = train_df.copy()
     test_scaled = test_df.copy()
 
-    train_scaled[features] = scaler.fit_transform(train_df[features])
+    train_scaled[features] = scaler.transform(train_df[features])
     test_scaled[features] = scaler.transform(test_df[features])
 
     return train_scaled, test_scaled
+
+
+def file_hash(path: str) -> str:
+    """
+    Return the SHA-256 hex digest of a file's contents.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def path_hash(path: str) -> str:
+    """
+    Return the SHA-256 of a file, or of every file path and content under a directory.
+    """
+    if not os.path.isdir(path):
+        return file_hash(path)
+    digest = hashlib.sha256()
+    for dirpath, dirnames, filenames in os.walk(path):
+        dirnames.sort()
+        for name in sorted(filenames):
+            file_path = os.path.join(dirpath, name)
+            digest.update(os.path.relpath(file_path, path).encode())
+            digest.update(file_hash(file_path).encode())
+    return digest.hexdigest()
+
+
+def save_preprocessor(scaler, output_path: str, data_hash: str) -> None:
+    """
+    Save a fitted scaler with its feature order and the hash of the data it produced.
+    """
+    with open(output_path, "wb") as f:
+        pickle.dump({
+            "scaler": scaler,
+            "features": list(scaler.feature_names_in_),
+            "data_hash": data_hash,
+        }, f)
+
+
+def load_preprocessor(path: str, data_path: str = None) -> dict:
+    """
+    Load a saved preprocessor.
+
+    If data_path is given, the preprocessor is rejected unless it was saved
+    alongside that exact file or partitioned dataset directory.
+    """
+    with open(path, "rb") as f:
+        preprocessor = pickle.load(f)
+    if data_path is not None and path_hash(data_path) != preprocessor["data_hash"]:
+        raise ValueError(
+            f"Preprocessor {path} does not match {data_path}; rerun data cleaning"
+        )
+    return preprocessor
+
+
+def apply_preprocessor(preprocessor: dict, df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Scale the raw feature columns of df with a loaded preprocessor.
+    """
+    missing = set(preprocessor["features"]) - set(df.columns)
+    if missing:
+        raise ValueError(f"Missing feature columns: {sorted(missing)}")
+    X = df[preprocessor["features"]]
+    return pd.DataFrame(
+        preprocessor["scaler"].transform(X), columns=X.columns, index=X.index
+    )
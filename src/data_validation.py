@@ -16,102 +16,161 @@ def validate_columns(df: pd.DataFrame) -> bool:
     """Check if columns exactly match the expected columns."""
     return set(df.columns) == set(EXPECTED_COLS)
 
-def validate_data_types(df: pd.DataFrame) -> bool:
-    """Validate data types of each column."""
+FEATURE_COLS = EXPECTED_COLS[:-1]
+CLASSES = ["Kecimen", "Besni"]
+MAX_MISSING_FRACTION = 0.05
+
+# Schemas are built once and only used to diagnose data that fails the fast checks
+DATA_TYPES_SCHEMA = pa.DataFrameSchema({
+    "Area": pa.Column(float),
+    "MajorAxisLength": pa.Column(float),
+    "MinorAxisLength": pa.Column(float),
+    "Eccentricity": pa.Column(float),
+    "ConvexArea": pa.Column(float),
+    "Extent": pa.Column(float),
+    "Perimeter": pa.Column(float),
+    "Class": pa.Column(str)
+})
+
+MISSING_VALUES_SCHEMA = pa.DataFrameSchema({
+    **{
+        col: pa.Column(float, pa.Check(
+            lambda s: s.isna().mean() <= MAX_MISSING_FRACTION,
+            element_wise=False, ignore_na=False,
+            error=f"More than {MAX_MISSING_FRACTION:.0%} missing values"
+        ), nullable=True)
+        for col in FEATURE_COLS
+    },
+    "Class": pa.Column(str, pa.Check.isin(CLASSES))
+})
+
+DUPLICATE_SCHEMA = pa.DataFrameSchema(
+    columns={
+        "Area": pa.Column(pa.Float, nullable=False),
+        "Perimeter": pa.Column(pa.Float, nullable=False),
+        "MajorAxisLength": pa.Column(pa.Float, nullable=False),
+        "MinorAxisLength": pa.Column(pa.Float, nullable=False),
+        "Eccentricity": pa.Column(pa.Float, nullable=False),
+        "ConvexArea": pa.Column(pa.Float, nullable=False),
+    },
+    checks=[
+        pa.Check(lambda df: not df.duplicated().any(),
+                 error="Duplicate rows found in the dataset.")
+    ]
+)
+DUPLICATE_COLS = list(DUPLICATE_SCHEMA.columns)
+
+
+def _check_input(df: pd.DataFrame) -> None:
     if df is None or df.empty:
         raise ValueError("Input DataFrame is empty or None")
-    if df.type != pd.DataFrame:
+    if not isinstance(df, pd.DataFrame):
         raise TypeError("Input is not a pandas DataFrame")
-    schema = pa.DataFrameSchema({
-        "Area": pa.Column(float),
-        "MajorAxisLength": pa.Column(float),
-        "MinorAxisLength": pa.Column(float),
-        "Eccentricity": pa.Column(float),
-        "ConvexArea": pa.Column(float),
-        "Extent": pa.Column(float),
-        "Perimeter": pa.Column(float),
-        "Class": pa.Column(str)
-    })
+
+
+def _float_matrix(df: pd.DataFrame, cols: list):
+    """Return the columns as one float64 array, or None if any is missing or not float64."""
+    if not all(col in df.columns and df[col].dtype == np.float64 for col in cols):
+        return None
+    return df[cols].to_numpy(dtype=np.float64, copy=False)
+
+
+def _diagnose(schema: pa.DataFrameSchema, df: pd.DataFrame, errors: list = None) -> bool:
+    """Validate with pandera, recording every failure in errors."""
     try:
-        schema.validate(df)
+        schema.validate(df, lazy=True)
         return True
-    except pa.errors.SchemaError:
+    except (pa.errors.SchemaErrors, pa.errors.SchemaError) as err:
+        if errors is not None:
+            errors.append(str(err))
         return False
 
-def check_nan(series: pd.Series) -> bool:
-    """Check if series has no NaN values"""
-    return ~series.isna().any()
-    
-def validate_missing_values(df: pd.DataFrame) -> bool:
-    """Validate no missing values in specified columns."""
-    if df is None or df.empty:
-        raise ValueError("Input DataFrame is empty or None")
-    if df.type != pd.DataFrame:
-        raise TypeError("Input is not a pandas DataFrame")
-    schema = pa.DataFrameSchema({
-        "Area": pa.Column(float, pa.Check(check_nan, element_wise=False), nullable=True),
-        "MajorAxisLength": pa.Column(float, pa.Check(check_nan, element_wise=False), nullable=True),
-        "MinorAxisLength": pa.Column(float, pa.Check(check_nan, element_wise=False), nullable=True),
-        "Eccentricity": pa.Column(float, nullable=True),
-        "ConvexArea": pa.Column(float, pa.Check(check_nan, element_wise=False), nullable=True),
-        "Extent": pa.Column(float, nullable=True),
-        "Perimeter": pa.Column(float, pa.Check(check_nan, element_wise=False), nullable=True),
-        "Class": pa.Column(str, pa.Check.isin(["Kecimen", "Besni"]))
-    })
-    try:
-        schema.validate(df)
-        return True
-    except pa.errors.SchemaError:
+
+def fast_validate_data_types(df: pd.DataFrame) -> bool:
+    """Vectorized check that features are non-null float64 and Class holds only strings."""
+    _check_input(df)
+    X = _float_matrix(df, FEATURE_COLS)
+    return (
+        X is not None
+        and not np.isnan(X).any()
+        and "Class" in df.columns
+        and pd.api.types.infer_dtype(df["Class"].to_numpy(), skipna=False) == "string"
+    )
+
+
+def fast_validate_missing_values(df: pd.DataFrame) -> bool:
+    """Vectorized check of per-column NaN fractions and Class membership."""
+    _check_input(df)
+    X = _float_matrix(df, FEATURE_COLS)
+    return (
+        X is not None
+        and bool((np.isnan(X).mean(axis=0) <= MAX_MISSING_FRACTION).all())
+        and "Class" in df.columns
+        and bool(np.isin(df["Class"].to_numpy(), CLASSES).all())
+    )
+
+
+def fast_validate_duplicates(df: pd.DataFrame) -> bool:
+    """Vectorized check for duplicate rows using one hash per row."""
+    _check_input(df)
+    X = _float_matrix(df, DUPLICATE_COLS)
+    if X is None or np.isnan(X).any():
         return False
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    return len(np.unique(row_hashes)) == len(row_hashes)
+
+
+def validate_features(df: pd.DataFrame) -> bool:
+    """Check that all feature columns are float64 without NaN; Class is not required."""
+    _check_input(df)
+    X = _float_matrix(df, FEATURE_COLS)
+    return X is not None and not np.isnan(X).any()
+
+
+def validate_data_types(df: pd.DataFrame, errors: list = None) -> bool:
+    """Validate data types of each column."""
+    return fast_validate_data_types(df) or _diagnose(DATA_TYPES_SCHEMA, df, errors)
+
+
+def validate_missing_values(df: pd.DataFrame, errors: list = None) -> bool:
+    """Validate at most MAX_MISSING_FRACTION missing values per feature and known Class labels."""
+    return fast_validate_missing_values(df) or _diagnose(MISSING_VALUES_SCHEMA, df, errors)
     
     
-def validate_duplicates(df: pd.DataFrame) -> bool:
+def validate_duplicates(df: pd.DataFrame, errors: list = None) -> bool:
     """Validate no duplicate rows in specified columns."""
-    if df is None or df.empty:
-        raise ValueError("Input DataFrame is empty or None")
-    if df.type != pd.DataFrame:
-        raise TypeError("Input is not a pandas DataFrame")
-    duplicate_schema = pa.DataFrameSchema(
-        columns={
-            "Area": pa.Column(pa.Float, nullable=False),
-            "Perimeter": pa.Column(pa.Float, nullable=False),
-            "MajorAxisLength": pa.Column(pa.Float, nullable=False),
-            "MinorAxisLength": pa.Column(pa.Float, nullable=False),
-            "Eccentricity": pa.Column(pa. Float, nullable=False),
-            "ConvexArea": pa. Column(pa.Float, nullable=False),
-        }, 
-        checks=[
-            pa. Check(lambda df: not df. duplicated().any(), 
-                    error="Duplicate rows found in the dataset.")
-        ]
-    )
-    try:
-        duplicate_schema.validate(df)
-        return True
-    except pa. errors.SchemaError:
-        return False
+    # A hash collision only sends the data to pandera for an exact check
+    return fast_validate_duplicates(df) or _diagnose(DUPLICATE_SCHEMA, df, errors)
     
 def validate_high_correlation(df: pd.DataFrame) -> list:
     """Identify features correlated >0.9 with other features."""
     if df is None or df.empty:
         raise ValueError("Input DataFrame is empty or None")
-    if df.type != pd.DataFrame:
+    if not isinstance(df, pd.DataFrame):
         raise TypeError("Input is not a pandas DataFrame")
-    corr_matrix = df.select_dtypes(include=[np.number]).corr().abs()
+    return high_correlation_features(df.select_dtypes(include=[np.number]).corr())
+
+def high_correlation_features(corr_matrix: pd.DataFrame, threshold: float = 0.9) -> list:
+    """Return features correlated above threshold with an earlier feature in corr_matrix."""
+    corr_matrix = corr_matrix.abs()
     upper_tri = corr_matrix.where(np.triu(np.ones(corr_matrix.shape), k=1).astype(bool))
-    to_drop = [column for column in upper_tri.columns if any(upper_tri[column] > 0.9)]
+    to_drop = [column for column in upper_tri.columns if any(upper_tri[column] > threshold)]
     return to_drop
 
 def validate_target_correlation(df: pd.DataFrame) -> list:
     """Return features highly correlated (>0.5) with 'Class'."""
     if df is None or df.empty:
         raise ValueError("Input DataFrame is empty or None")
-    if df.type != pd.DataFrame:
+    if not isinstance(df, pd.DataFrame):
         raise TypeError("Input is not a pandas DataFrame")
     df_encoded = df.copy()
     df_encoded['Class'] = df_encoded['Class'].astype('category').cat.codes
-    corr_with_target = df_encoded.corr()['Class'].abs()
-    high_corr_features = corr_with_target[corr_with_target > 0.5].index.tolist()
+    return target_correlation_features(df_encoded.corr())
+
+def target_correlation_features(corr_matrix: pd.DataFrame, threshold: float = 0.5) -> list:
+    """Return features whose correlation with the encoded 'Class' exceeds threshold."""
+    corr_with_target = corr_matrix['Class'].abs()
+    high_corr_features = corr_with_target[corr_with_target > threshold].index.tolist()
     if 'Class' in high_corr_features:
         high_corr_features.remove('Class')
     return high_corr_features
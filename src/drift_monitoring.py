@@ -0,0 +1,178 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+from src.data_validation import EXPECTED_COLS
+
+FEATURES = [col for col in EXPECTED_COLS if col != "Class"]
+ALL = "__all__"
+
+
+def fit_reference(df: pd.DataFrame, n_bins: int = 10, preprocessor_hash: str = None) -> dict:
+    """
+    Build the reference sketch from training data.
+
+    Bin edges are the training deciles (or n_bins quantiles) of each feature,
+    so every later sketch uses the same bins and can be merged or compared.
+    preprocessor_hash identifies the preprocessor that scaled df (the data
+    hash it was saved with); None means df holds raw measurements. Batches
+    must be in the same space before they are compared.
+    """
+    if df is None or df.empty:
+        raise ValueError("Input DataFrame is empty or None")
+    quantiles = np.linspace(0, 1, n_bins + 1)[1:-1]
+    edges = {
+        feature: np.unique(np.quantile(df[feature].to_numpy(dtype=float), quantiles)).tolist()
+        for feature in FEATURES
+    }
+    return {**summarize(df, edges), "preprocessor_hash": preprocessor_hash}
+
+
+def _feature_summary(values: np.ndarray, edges: list) -> dict:
+    values = values[~np.isnan(values)]
+    n = len(values)
+    mean = float(values.mean()) if n else 0.0
+    return {
+        "n": n,
+        "mean": mean,
+        "m2": float(((values - mean) ** 2).sum()) if n else 0.0,
+        "min": float(values.min()) if n else None,
+        "max": float(values.max()) if n else None,
+        "bins": np.bincount(
+            np.searchsorted(edges, values, side="right"), minlength=len(edges) + 1
+        ).tolist(),
+    }
+
+
+def summarize(df: pd.DataFrame, edges: dict) -> dict:
+    """
+    Sketch a chunk of data against fixed bin edges in a single pass.
+
+    The sketch holds, for all rows and for each Class, the count, running
+    mean/variance, min/max and binned counts of every feature, plus Class counts.
+    """
+    groups = {ALL: df}
+    if "Class" in df.columns:
+        groups.update({str(label): rows for label, rows in df.groupby("Class")})
+    return {
+        "edges": edges,
+        "class_counts": (
+            {str(k): int(v) for k, v in df["Class"].value_counts().items()}
+            if "Class" in df.columns else {}
+        ),
+        "groups": {
+            name: {
+                feature: _feature_summary(rows[feature].to_numpy(dtype=float), edges[feature])
+                for feature in FEATURES
+            }
+            for name, rows in groups.items()
+        },
+    }
+
+
+def _merge_feature(a: dict, b: dict) -> dict:
+    n = a["n"] + b["n"]
+    if n == 0:
+        return dict(a)
+    delta = b["mean"] - a["mean"]
+    present = [v for v in (a, b) if v["n"]]
+    return {
+        "n": n,
+        "mean": a["mean"] + delta * b["n"] / n,
+        "m2": a["m2"] + b["m2"] + delta ** 2 * a["n"] * b["n"] / n,
+        "min": min(v["min"] for v in present),
+        "max": max(v["max"] for v in present),
+        "bins": [x + y for x, y in zip(a["bins"], b["bins"])],
+    }
+
+
+def merge_sketches(*sketches: dict) -> dict:
+    """Combine sketches built with the same bin edges, e.g. from several workers."""
+    if not sketches:
+        raise ValueError("No sketches to merge")
+    merged = sketches[0]
+    for sketch in sketches[1:]:
+        if sketch["edges"] != merged["edges"]:
+            raise ValueError("Sketches were built with different bin edges")
+        class_counts = dict(merged["class_counts"])
+        for label, count in sketch["class_counts"].items():
+            class_counts[label] = class_counts.get(label, 0) + count
+        groups = {}
+        for name in {**merged["groups"], **sketch["groups"]}:
+            if name not in sketch["groups"]:
+                groups[name] = merged["groups"][name]
+            elif name not in merged["groups"]:
+                groups[name] = sketch["groups"][name]
+            else:
+                groups[name] = {
+                    feature: _merge_feature(merged["groups"][name][feature], sketch["groups"][name][feature])
+                    for feature in FEATURES
+                }
+        merged = {"edges": merged["edges"], "class_counts": class_counts, "groups": groups}
+    return merged
+
+
+def _psi(expected: np.ndarray, actual: np.ndarray, eps: float = 1e-4) -> float:
+    p = np.clip(expected / expected.sum(), eps, None)
+    q = np.clip(actual / actual.sum(), eps, None)
+    return float(((q - p) * np.log(q / p)).sum())
+
+
+def _ks(expected: np.ndarray, actual: np.ndarray) -> float:
+    return float(np.abs(np.cumsum(expected) / expected.sum() - np.cumsum(actual) / actual.sum()).max())
+
+
+def drift_report(reference: dict, sketch: dict) -> pd.DataFrame:
+    """
+    Compare a chunk sketch with the reference sketch.
+
+    Returns one row per group and feature with the population stability index,
+    the KS statistic over the reference bins, and the mean shift in reference
+    standard deviations. Class balance is reported as feature "Class".
+    """
+    if sketch["edges"] != reference["edges"]:
+        raise ValueError("Sketch was not built with the reference bin edges")
+    rows = []
+    for name, features in sketch["groups"].items():
+        if name not in reference["groups"]:
+            continue
+        for feature in FEATURES:
+            ref, cur = reference["groups"][name][feature], features[feature]
+            if not ref["n"] or not cur["n"]:
+                continue
+            expected, actual = np.array(ref["bins"], float), np.array(cur["bins"], float)
+            std = np.sqrt(ref["m2"] / ref["n"])
+            rows.append({
+                "group": name,
+                "feature": feature,
+                "n": cur["n"],
+                "psi": _psi(expected, actual),
+                "ks": _ks(expected, actual),
+                "mean_shift": (cur["mean"] - ref["mean"]) / std if std else 0.0,
+            })
+    if reference["class_counts"] and sketch["class_counts"]:
+        labels = sorted(set(reference["class_counts"]) | set(sketch["class_counts"]))
+        expected = np.array([reference["class_counts"].get(k, 0) for k in labels], float)
+        actual = np.array([sketch["class_counts"].get(k, 0) for k in labels], float)
+        rows.append({
+            "group": ALL,
+            "feature": "Class",
+            "n": int(actual.sum()),
+            "psi": _psi(expected, actual),
+            "ks": _ks(expected, actual),
+            "mean_shift": np.nan,
+        })
+    return pd.DataFrame(rows, columns=["group", "feature", "n", "psi", "ks", "mean_shift"])
+
+
+def save_sketch(sketch: dict, output_path: str) -> None:
+    """Save a sketch as JSON."""
+    with open(output_path, "w") as f:
+        json.dump(sketch, f)
+
+
+def load_sketch(path: str) -> dict:
+    """Load a sketch saved with save_sketch."""
+    with open(path) as f:
+        return json.load(f)
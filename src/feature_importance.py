@@ -0,0 +1,90 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from src.model_comparison import share_array, attach_array
+
+# Per-worker state: the model, a private copy of the test matrix and the labels
+_WORKER = {}
+
+
+def _init_worker(clf, test_spec, y_test):
+    """Attach the shared test matrix, keep one private copy to permute and score it once."""
+    shm, X_shared = attach_array(*test_spec)
+    X = X_shared.copy()
+    shm.close()
+    _WORKER.update(clf=clf, X=X, y=y_test, baseline=_accuracy(clf, X, y_test, 1)[0])
+
+
+def _accuracy(clf, X: np.ndarray, y: np.ndarray, n_repeats: int) -> np.ndarray:
+    """Accuracy of each of n_repeats stacked copies of the test rows, from one predict call."""
+    if hasattr(clf, "predict_proba"):
+        y_pred = clf.classes_[clf.predict_proba(X).argmax(axis=1)]
+    else:
+        y_pred = clf.predict(X)
+    return (y_pred.reshape(n_repeats, -1) == y).mean(axis=1)
+
+
+def permute_feature(task: tuple) -> tuple:
+    """Accuracy drops over one chunk of shuffles of one feature column."""
+    column, n_repeats, seed = task
+    clf, X, y = _WORKER["clf"], _WORKER["X"], _WORKER["y"]
+    start = time.perf_counter()
+    rng = np.random.default_rng(seed)
+
+    # Stack every repeat into one matrix and shuffle the column in place
+    stacked = np.tile(X, (n_repeats, 1))
+    stacked[:, column] = rng.permuted(np.tile(X[:, column], (n_repeats, 1)), axis=1).ravel()
+    drops = _WORKER["baseline"] - _accuracy(clf, stacked, y, n_repeats)
+
+    return column, drops, time.perf_counter() - start
+
+
+def permutation_importance(clf, X_test, y_test, feature_names, n_repeats=10,
+                           n_jobs=None, random_state=123) -> pd.DataFrame:
+    """
+    Mean and standard deviation of the accuracy drop when each feature is shuffled.
+
+    The test matrix is shared read-only between worker processes; each worker
+    permutes a private copy. The repeats of each feature are split into chunks
+    so there are enough tasks for every worker, and each chunk is scored in one
+    predict_proba call. seconds is the worker time summed over a feature's chunks.
+    """
+    X_test = np.ascontiguousarray(X_test, dtype=np.float64)
+    y_test = np.asarray(y_test)
+    n_features = X_test.shape[1]
+    n_workers = n_jobs or os.cpu_count() or 1
+    n_chunks = min(n_repeats, -(-n_workers // n_features))
+    chunk_sizes = [len(c) for c in np.array_split(np.arange(n_repeats), n_chunks)]
+    seeds = np.random.SeedSequence(random_state).spawn(n_features * n_chunks)
+    tasks = [
+        (j, size, seeds[j * n_chunks + k])
+        for j in range(n_features)
+        for k, size in enumerate(chunk_sizes)
+    ]
+
+    shm = share_array(X_test)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=min(n_workers, len(tasks)),
+            initializer=_init_worker,
+            initargs=(clf, (shm.name, X_test.shape, X_test.dtype), y_test),
+        ) as pool:
+            results = list(pool.map(permute_feature, tasks))
+    finally:
+        shm.close()
+        shm.unlink()
+
+    rows = []
+    for j, name in enumerate(feature_names):
+        drops = np.concatenate([d for column, d, _ in results if column == j])
+        rows.append({
+            "feature": name,
+            "importance": float(drops.mean()),
+            "std": float(drops.std()),
+            "seconds": sum(t for column, _, t in results if column == j),
+        })
+    return pd.DataFrame(rows).sort_values("importance", ascending=False)
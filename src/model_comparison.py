@@ -0,0 +1,145 @@
+import json
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from multiprocessing import shared_memory
+
+import numpy as np
+from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score
+from sklearn.svm import LinearSVC
+
+ESTIMATORS = {
+    "logistic_regression": lambda: LogisticRegression(max_iter=2000, random_state=123),
+    "linear_svm": lambda: LinearSVC(max_iter=5000, random_state=123),
+    "gradient_boosting": lambda: GradientBoostingClassifier(random_state=123),
+    "random_forest": lambda: RandomForestClassifier(n_estimators=200, random_state=123),
+}
+
+# Views onto the shared training/test matrices, set once per worker process
+_SHARED = {}
+
+
+def share_array(arr: np.ndarray) -> shared_memory.SharedMemory:
+    """Copy an array into a new shared memory block."""
+    shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+    np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[:] = arr
+    return shm
+
+
+def attach_array(name, shape, dtype):
+    """Attach to an array created with share_array; keep the returned block open while in use."""
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _init_worker(train_spec, test_spec, y_train, y_test):
+    """Attach the shared matrices in a worker process."""
+    train_shm, X_train = attach_array(*train_spec)
+    test_shm, X_test = attach_array(*test_spec)
+    _SHARED.update(
+        shms=(train_shm, test_shm),
+        X_train=X_train, X_test=X_test, y_train=y_train, y_test=y_test,
+    )
+
+
+def evaluate_estimator(name: str) -> dict:
+    """Fit one registered estimator on the shared data and score it."""
+    X_train, X_test = _SHARED["X_train"], _SHARED["X_test"]
+    clf = ESTIMATORS[name]()
+
+    start = time.perf_counter()
+    clf.fit(X_train, _SHARED["y_train"])
+    fit_seconds = time.perf_counter() - start
+
+    model_bytes = pickle.dumps(clf)
+    return {
+        "estimator": name,
+        "fit_seconds": fit_seconds,
+        "model_size_bytes": len(model_bytes),
+        "accuracy": accuracy_score(_SHARED["y_test"], clf.predict(X_test)),
+        "model": model_bytes,
+    }
+
+
+def predict_latency_ms_per_1k(clf, X: np.ndarray, min_rows: int = 1000, repeats: int = 7) -> float:
+    """
+    Best-of-repeats predict time per 1k rows, on X tiled to at least min_rows rows.
+    """
+    X = np.tile(X, (-(-min_rows // len(X)), 1))
+    clf.predict(X[:1])  # warm-up
+    best = min(_timed(clf.predict, X) for _ in range(repeats))
+    return best * 1000 * 1000 / len(X)
+
+
+def _timed(func, *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def compare_estimators(X_train, y_train, X_test, y_test, names, n_jobs=None) -> list:
+    """
+    Train the named estimators concurrently and return one result dict per estimator.
+
+    The feature matrices are placed in shared memory once and read by every worker.
+    Predict latency is measured afterwards, one model at a time in this process,
+    so it is not skewed by fits still running in other workers.
+    """
+    unknown = set(names) - set(ESTIMATORS)
+    if unknown:
+        raise ValueError(f"Unknown estimators: {sorted(unknown)}")
+    X_train = np.ascontiguousarray(X_train, dtype=np.float64)
+    X_test = np.ascontiguousarray(X_test, dtype=np.float64)
+    train_shm = share_array(X_train)
+    test_shm = share_array(X_test)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=n_jobs or min(len(names), os.cpu_count() or 1),
+            initializer=_init_worker,
+            initargs=(
+                (train_shm.name, X_train.shape, X_train.dtype),
+                (test_shm.name, X_test.shape, X_test.dtype),
+                np.asarray(y_train),
+                np.asarray(y_test),
+            ),
+        ) as pool:
+            results = list(pool.map(evaluate_estimator, names))
+    finally:
+        for shm in (train_shm, test_shm):
+            shm.close()
+            shm.unlink()
+    for result in results:
+        result["model"] = pickle.loads(result["model"])
+        result["predict_ms_per_1k"] = predict_latency_ms_per_1k(result["model"], X_test)
+    return results
+
+
+def select_winner(results: list, latency_budget_ms: float = None) -> dict:
+    """Return the most accurate result whose predict latency per 1k rows fits the budget."""
+    eligible = [
+        r for r in results
+        if latency_budget_ms is None or r["predict_ms_per_1k"] <= latency_budget_ms
+    ]
+    if not eligible:
+        raise ValueError(f"No estimator predicts within {latency_budget_ms} ms per 1k rows")
+    return max(eligible, key=lambda r: (r["accuracy"], -r["predict_ms_per_1k"]))
+
+
+def update_registry(registry_path: str, results: list, winner: dict, latency_budget_ms: float = None) -> None:
+    """Append a comparison run to the JSON model registry."""
+    runs = []
+    if os.path.exists(registry_path):
+        with open(registry_path) as f:
+            runs = json.load(f)
+    runs.append({
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "latency_budget_ms": latency_budget_ms,
+        "winner": winner["estimator"],
+        "models": [{k: v for k, v in r.items() if k != "model"} for r in results],
+    })
+    with open(registry_path, "w") as f:
+        json.dump(runs, f, indent=2)
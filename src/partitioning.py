@@ -0,0 +1,165 @@
+import json
+import operator
+import os
+
+import pandas as pd
+
+from src.data_validation import FEATURE_COLS
+
+PARTITION_COLS = ["ingest_date", "Class"]
+MANIFEST = "_manifest.json"
+
+# Longest operators first so "<=" is not read as "<"
+OPERATORS = {
+    "<=": operator.le,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    ">": operator.gt,
+}
+
+
+def _stats(df: pd.DataFrame) -> dict:
+    return {
+        col: {"min": float(df[col].min()), "max": float(df[col].max())}
+        for col in FEATURE_COLS
+        if col in df.columns and pd.api.types.is_numeric_dtype(df[col]) and df[col].notna().any()
+    }
+
+
+def load_manifest(root: str) -> dict:
+    """Load the partition manifest of a dataset directory."""
+    path = os.path.join(root, MANIFEST)
+    if not os.path.exists(path):
+        return {"partitions": []}
+    with open(path) as f:
+        return json.load(f)
+
+
+def write_partitioned(df: pd.DataFrame, root: str, ingest_date: str = None,
+                      scaled: bool = False) -> dict:
+    """
+    Write df under root as ingest_date=<date>/Class=<label>/part-0.csv.
+
+    If df has no ingest_date column, every row gets ingest_date. The manifest
+    records each partition's row count and per-feature min/max, and whether the
+    features are standardized (scaled=True) rather than raw measurements.
+    Rewriting a partition replaces it, so re-ingesting a day is idempotent.
+    """
+    if "ingest_date" not in df.columns:
+        if ingest_date is None:
+            raise ValueError("ingest_date is required when df has no ingest_date column")
+        df = df.assign(ingest_date=ingest_date)
+    manifest = load_manifest(root)
+    if manifest["partitions"] and manifest.get("scaled", False) != scaled:
+        raise ValueError(f"Cannot mix raw and scaled features in {root}")
+    partitions = {p["path"]: p for p in manifest["partitions"]}
+
+    for values, rows in df.groupby(PARTITION_COLS):
+        values = dict(zip(PARTITION_COLS, map(str, values)))
+        rel_dir = os.path.join(*(f"{k}={v}" for k, v in values.items()))
+        rel_path = os.path.join(rel_dir, "part-0.csv")
+        os.makedirs(os.path.join(root, rel_dir), exist_ok=True)
+        rows = rows.drop(columns=PARTITION_COLS)
+        rows.to_csv(os.path.join(root, rel_path), index=False)
+        partitions[rel_path] = {"path": rel_path, "values": values, "rows": len(rows), "stats": _stats(rows)}
+
+    manifest = {"scaled": scaled, "partitions": sorted(partitions.values(), key=lambda p: p["path"])}
+    with open(os.path.join(root, MANIFEST), "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def parse_filter(expression: str) -> tuple:
+    """Parse "column<op>value", e.g. "ingest_date>=2024-01-01" or "Area<90000"."""
+    for symbol in OPERATORS:
+        column, sep, value = expression.partition(symbol)
+        if sep:
+            column, value = column.strip(), value.strip()
+            if not column or not value:
+                break
+            # Partition keys are compared as strings (ISO dates sort correctly)
+            if column not in PARTITION_COLS:
+                try:
+                    value = float(value)
+                except ValueError:
+                    break
+            return column, symbol, value
+    raise ValueError(f"Invalid filter expression: {expression!r}")
+
+
+def _may_match(partition: dict, column: str, symbol: str, value) -> bool:
+    """Whether any row of the partition can satisfy the filter."""
+    if column in partition["values"]:
+        return OPERATORS[symbol](partition["values"][column], value)
+    stats = partition["stats"].get(column)
+    if stats is None:
+        return True
+    low, high = stats["min"], stats["max"]
+    return {
+        "==": low <= value <= high,
+        "!=": not (low == high == value),
+        "<": low < value,
+        "<=": low <= value,
+        ">": high > value,
+        ">=": high >= value,
+    }[symbol]
+
+
+def prune_partitions(manifest: dict, filters: list) -> list:
+    """Return the partitions that may contain rows matching every filter."""
+    return [
+        p for p in manifest["partitions"]
+        if all(_may_match(p, *f) for f in filters)
+    ]
+
+
+def read_partitioned(root: str, filters: list = None, columns: list = None) -> pd.DataFrame:
+    """
+    Read the rows of a partitioned dataset that match filters.
+
+    filters are expressions accepted by parse_filter. Partitions are pruned on
+    their key values and feature min/max before any file is opened, and only
+    the requested columns plus those used in filters are parsed. Datasets of
+    scaled features only accept partition key filters, since thresholds are
+    given in raw measurement units.
+    """
+    filters = [parse_filter(f) if isinstance(f, str) else f for f in (filters or [])]
+    manifest = load_manifest(root)
+    if not manifest["partitions"]:
+        raise ValueError(f"No partitions found in {root}")
+    known = set(PARTITION_COLS) | {
+        col for p in manifest["partitions"] for col in p["stats"]
+    }
+    unknown = {f[0] for f in filters} - known
+    if unknown:
+        raise ValueError(f"Cannot filter on unknown columns: {sorted(unknown)}")
+    if manifest.get("scaled"):
+        feature_filters = sorted({f[0] for f in filters} - set(PARTITION_COLS))
+        if feature_filters:
+            raise ValueError(
+                f"{root} holds scaled features; filter on {feature_filters} before scaling "
+                f"(e.g. sc2 --filter) or on partition keys {PARTITION_COLS}"
+            )
+
+    needed = None
+    if columns is not None:
+        needed = set(columns) | {f[0] for f in filters}
+
+    frames = []
+    for partition in prune_partitions(manifest, filters):
+        df = pd.read_csv(
+            os.path.join(root, partition["path"]),
+            usecols=None if needed is None else lambda col: col in needed,
+        )
+        for key, value in partition["values"].items():
+            if needed is None or key in needed:
+                df[key] = value
+        for column, symbol, value in filters:
+            df = df[OPERATORS[symbol](df[column], value)]
+        frames.append(df)
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    df = pd.concat(frames, ignore_index=True)
+    return df if columns is None else df[columns]
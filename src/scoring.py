@@ -0,0 +1,206 @@
+import json
+import os
+import pickle
+import queue
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.data_cleaning import clean_data
+from src.data_validation import (
+    validate_file_format,
+    validate_data_types,
+    validate_missing_values,
+    validate_features,
+)
+
+
+def load_model(model_path: str) -> dict:
+    """
+    Load the model pickled by sc5_model_fitting.py.
+
+    Only models fitted with the sc2 preprocessor are accepted, since their
+    scaler is the one that takes raw measurements.
+    """
+    with open(model_path, "rb") as f:
+        bundle = pickle.load(f)
+    if "features" not in bundle or bundle.get("scaler_input") != "raw":
+        raise ValueError(
+            f"{model_path} was not fitted with the sc2 preprocessor, so its scaler does not "
+            "apply to raw measurements; retrain with sc5_model_fitting.py --preprocessor"
+        )
+    return bundle
+
+
+def prepare_batch(df: pd.DataFrame) -> pd.DataFrame:
+    """Clean a batch of raw measurements and validate it, raising ValueError if invalid."""
+    df = clean_data(df)
+    if df.empty:
+        raise ValueError("No complete rows after cleaning")
+    if "Class" in df.columns:
+        errors = []
+        if not (validate_data_types(df, errors=errors) and validate_missing_values(df, errors=errors)):
+            raise ValueError("\n".join(errors) or "Validation failed")
+    elif not validate_features(df):
+        raise ValueError("Feature columns are missing or not numeric")
+    return df
+
+
+def score_batch(bundle: dict, df: pd.DataFrame) -> pd.DataFrame:
+    """Scale the raw features once and predict each row."""
+    X = bundle["scaler"].transform(df[bundle["features"]])
+    scored = df.copy()
+    scored["prediction"] = bundle["model"].predict(X)
+    if hasattr(bundle["model"], "predict_proba"):
+        scored["probability"] = bundle["model"].predict_proba(X).max(axis=1)
+    return scored
+
+
+def file_key(path: str) -> str:
+    """Identify a landed file by name, size and modification time."""
+    stat = os.stat(path)
+    return f"{os.path.basename(path)}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def read_ledger(ledger_path: str) -> set:
+    """Return the keys of files already recorded in the ledger."""
+    if not os.path.exists(ledger_path):
+        return set()
+    with open(ledger_path) as f:
+        return {json.loads(line)["key"] for line in f if line.strip()}
+
+
+def append_ledger(ledger_path: str, record: dict) -> None:
+    """Append one record to the JSON-lines ledger."""
+    with open(ledger_path, "a") as f:
+        f.write(json.dumps(record) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def process_file(bundle: dict, path: str, output_dir: str) -> dict:
+    """Clean, validate and score one file and write its predictions."""
+    record = {"file": path}
+    try:
+        # Inside the try: the file may vanish between queueing and scoring
+        landed = os.stat(path).st_mtime
+        scored = score_batch(bundle, prepare_batch(pd.read_csv(path)))
+    except Exception as err:
+        # Record the failure instead of stopping the watcher on one bad file
+        record.update(status="failed", error=str(err))
+        return record
+    output_path = os.path.join(output_dir, os.path.basename(path).replace(".csv", "_predictions.csv"))
+    # Write then rename so a crash never leaves a partial predictions file
+    scored.to_csv(output_path + ".tmp", index=False)
+    os.replace(output_path + ".tmp", output_path)
+    record.update(status="scored", rows=len(scored), output=output_path,
+                  latency_seconds=time.time() - landed)
+    return record
+
+
+def watch(input_dir: str, output_dir: str, bundle: dict, ledger_path: str,
+          queue_size: int = 8, workers: int = 1, poll_interval: float = 1.0,
+          settle_seconds: float = 1.0, once: bool = False, on_record=None,
+          stop_event: threading.Event = None) -> list:
+    """
+    Score CSV files as they land in input_dir.
+
+    A polling producer puts each new file on a bounded queue; it blocks when
+    the queue is full, so landing bursts wait on disk instead of in memory.
+    Consumer threads share the already loaded model. A file is recorded in
+    the ledger only after its predictions are written, so files in flight
+    during a crash are scored again on restart (at-least-once). Files are
+    picked up once unmodified for settle_seconds. With once=True the files
+    present at start are processed and the function returns.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    stop_event = stop_event or threading.Event()
+    done = read_ledger(ledger_path)
+    pending = set()
+    files = queue.Queue(maxsize=queue_size)
+    records = []
+    lock = threading.Lock()
+
+    def produce():
+        while not stop_event.is_set():
+            now = time.time()
+            for entry in sorted(os.scandir(input_dir), key=lambda e: e.name):
+                if not entry.is_file() or not validate_file_format(entry.name):
+                    continue
+                try:
+                    stat = entry.stat()
+                    key = file_key(entry.path)
+                except FileNotFoundError:
+                    # Removed after the directory was listed
+                    continue
+                if key in done or key in pending or now - stat.st_mtime < settle_seconds:
+                    continue
+                pending.add(key)
+                while not stop_event.is_set():
+                    try:
+                        files.put((entry.path, key), timeout=poll_interval)
+                        break
+                    except queue.Full:
+                        continue
+            if once:
+                break
+            stop_event.wait(poll_interval)
+        for _ in range(workers):
+            files.put(None)
+
+    def consume():
+        while True:
+            item = files.get()
+            if item is None:
+                return
+            path, key = item
+            # Any error ends up in a failed record; a dead worker would leave
+            # its queued files unscored and watch() waiting forever
+            try:
+                record = {"key": key, **process_file(bundle, path, output_dir)}
+            except Exception as err:
+                record = {"key": key, "file": path, "status": "failed", "error": str(err)}
+            with lock:
+                pending.discard(key)
+                records.append(record)
+                try:
+                    append_ledger(ledger_path, record)
+                    done.add(key)
+                except OSError as err:
+                    record["ledger_error"] = str(err)
+            if on_record is not None:
+                try:
+                    on_record(record)
+                except Exception:
+                    # Reporting a record must not stop scoring the next one
+                    pass
+
+    threads = [threading.Thread(target=produce, daemon=True)]
+    threads += [threading.Thread(target=consume, daemon=True) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    try:
+        for thread in threads:
+            while thread.is_alive():
+                thread.join(timeout=0.5)
+    except KeyboardInterrupt:
+        stop_event.set()
+        for thread in threads:
+            thread.join()
+    return records
+
+
+def latency_summary(records: list) -> dict:
+    """Summarize landing-to-prediction latency of scored records."""
+    latencies = np.array([r["latency_seconds"] for r in records if r["status"] == "scored"])
+    if not len(latencies):
+        return {"files": 0}
+    return {
+        "files": len(latencies),
+        "mean_seconds": float(latencies.mean()),
+        "p50_seconds": float(np.percentile(latencies, 50)),
+        "p95_seconds": float(np.percentile(latencies, 95)),
+        "max_seconds": float(latencies.max()),
+    }
@@ -0,0 +1,142 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from src.data_validation import (
+    EXPECTED_COLS,
+    FEATURE_COLS,
+    CLASSES,
+    validate_file_format,
+    validate_columns,
+    validate_data_types,
+    validate_missing_values,
+    validate_duplicates,
+    high_correlation_features,
+    target_correlation_features,
+)
+
+# Column order for the correlation partials; Class is encoded like
+# validate_target_correlation does (category codes, i.e. sorted labels)
+CORR_COLS = FEATURE_COLS + ["Class"]
+
+
+def correlation_partial(df: pd.DataFrame) -> dict:
+    """
+    Sufficient statistics for the correlation matrix of one shard.
+
+    Rows with a missing value or a Class outside CLASSES are left out, so
+    merged results use complete, labelled rows only.
+    """
+    encoded = df[CORR_COLS].copy()
+    encoded["Class"] = encoded["Class"].map({label: code for code, label in enumerate(sorted(CLASSES))})
+    X = encoded.to_numpy(dtype=np.float64)
+    X = X[~np.isnan(X).any(axis=1)]
+    return {"n": len(X), "sum": X.sum(axis=0), "cross": X.T @ X}
+
+
+def merge_correlation_partials(partials: list) -> pd.DataFrame:
+    """Combine shard partials into one correlation matrix over CORR_COLS."""
+    n = sum(p["n"] for p in partials)
+    if n < 2:
+        raise ValueError("Not enough complete rows to compute correlations")
+    total = sum(p["sum"] for p in partials)
+    cross = sum(p["cross"] for p in partials)
+    cov = (cross - np.outer(total, total) / n) / (n - 1)
+    std = np.sqrt(np.diag(cov))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = cov / np.outer(std, std)
+    return pd.DataFrame(corr, index=CORR_COLS, columns=CORR_COLS)
+
+
+def validate_file(input_path: str) -> dict:
+    """
+    Run every check in src/data_validation.py on one file.
+
+    Unlike sc3 in single-file mode, all checks run so the report lists every
+    failure, and an unreadable file or a failing check is recorded instead of
+    stopping the run. The result also carries the per-shard partials used for
+    the cross-file duplicate and correlation results.
+    """
+    result = {"path": input_path, "rows": 0, "failures": [], "errors": [],
+              "row_hashes": None, "corr_partial": None}
+    try:
+        _run_checks(input_path, result)
+    except Exception as err:
+        result["failures"].append("error")
+        result["errors"].append(f"{type(err).__name__}: {err}")
+    return result
+
+
+def _run_checks(input_path: str, result: dict) -> None:
+    if not validate_file_format(input_path):
+        result["failures"].append("file format")
+        return
+    try:
+        df = pd.read_csv(input_path)
+    except (OSError, ValueError) as err:
+        # pandas parse errors and empty files are ValueErrors
+        result["failures"].append("unreadable")
+        result["errors"].append(f"{type(err).__name__}: {err}")
+        return
+    result["rows"] = len(df)
+    if df.empty:
+        result["failures"].append("empty file")
+        return
+    if not validate_columns(df):
+        result["failures"].append("columns")
+        return
+
+    checks = [
+        ("data types", validate_data_types),
+        ("missing values", validate_missing_values),
+        ("duplicates", validate_duplicates),
+    ]
+    for name, check in checks:
+        if not check(df, errors=result["errors"]):
+            result["failures"].append(name)
+
+    result["row_hashes"] = np.unique(pd.util.hash_pandas_object(df[EXPECTED_COLS], index=False).to_numpy())
+    # Only files with valid types and known Class labels feed the correlations
+    if not {"data types", "missing values"} & set(result["failures"]):
+        result["corr_partial"] = correlation_partial(df)
+
+
+def merge_results(results: list) -> dict:
+    """Aggregate per-file results into one report."""
+    hashes = [r["row_hashes"] for r in results if r["row_hashes"] is not None]
+    cross_file_duplicates = 0
+    if hashes:
+        # Each file contributes its distinct rows once, so a count > 1 means several files
+        _, counts = np.unique(np.concatenate(hashes), return_counts=True)
+        cross_file_duplicates = int((counts > 1).sum())
+
+    partials = [r["corr_partial"] for r in results if r["corr_partial"] is not None]
+    high_correlation, target_correlation = [], []
+    if partials:
+        corr = merge_correlation_partials(partials)
+        high_correlation = high_correlation_features(corr.loc[FEATURE_COLS, FEATURE_COLS])
+        target_correlation = target_correlation_features(corr)
+
+    return {
+        "files": [
+            {"path": r["path"], "rows": r["rows"], "passed": not r["failures"],
+             "failures": r["failures"], "errors": r["errors"]}
+            for r in results
+        ],
+        "files_failed": sum(1 for r in results if r["failures"]),
+        "rows": sum(r["rows"] for r in results),
+        "cross_file_duplicates": cross_file_duplicates,
+        "high_correlation": high_correlation,
+        "target_correlation": target_correlation,
+    }
+
+
+def validate_files(input_paths: list, n_jobs: int = None) -> dict:
+    """Validate files in parallel and return the aggregated report."""
+    if not input_paths:
+        raise ValueError("No input files to validate")
+    with ProcessPoolExecutor(max_workers=n_jobs or min(len(input_paths), os.cpu_count() or 1)) as pool:
+        results = list(pool.map(validate_file, input_paths))
+    return merge_results(results)
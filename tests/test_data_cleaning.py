@@ -1,8 +1,12 @@
 import pandas as pd
+import pytest
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from src.data_cleaning import clean_data, split_data, scale_features
+from src.data_cleaning import (
+    clean_data, split_data, scale_features, fit_scaler,
+    file_hash, save_preprocessor, load_preprocessor, apply_preprocessor
+)
 
 
 def test_clean_data():
@@ -61,3 +65,61 @@ def test_scale_features():
 
     # Check that class column is not scaled
     assert train_scaled["Class"].dtype == object
+
+
+def test_scale_features_with_fitted_scaler():
+    train = pd.DataFrame({
+        "Area": [1.0, 2.0, 3.0],
+        "ConvexArea": [3.0, 4.0, 5.0],
+        "Class": ["A", "B", "A"]
+    })
+
+    test = pd.DataFrame({
+        "Area": [4.0],
+        "ConvexArea": [6.0],
+        "Class": ["B"]
+    })
+
+    scaler = fit_scaler(train)
+    train_scaled, test_scaled = scale_features(train, test, scaler=scaler)
+
+    # Check that the given scaler is applied as-is
+    assert abs(scaler.mean_[0] - 2.0) < 1e-6
+    assert test_scaled["Area"].iloc[0] == scaler.transform(test[["Area", "ConvexArea"]])[0, 0]
+
+
+def test_preprocessor_round_trip(tmp_path):
+    train = pd.DataFrame({
+        "Area": [1.0, 2.0, 3.0],
+        "ConvexArea": [3.0, 4.0, 5.0],
+        "Class": ["A", "B", "A"]
+    })
+    data_path = tmp_path / "train.csv"
+    train.to_csv(data_path, index=False)
+    preprocessor_path = tmp_path / "preprocessor.pkl"
+
+    save_preprocessor(fit_scaler(train), preprocessor_path, file_hash(data_path))
+    preprocessor = load_preprocessor(preprocessor_path, data_path=data_path)
+
+    # Check that raw features are scaled once, in the saved column order
+    raw = pd.DataFrame({"ConvexArea": [4.0], "Area": [2.0]})
+    scaled = apply_preprocessor(preprocessor, raw)
+    assert list(scaled.columns) == ["Area", "ConvexArea"]
+    assert abs(scaled["Area"].iloc[0]) < 1e-6
+
+
+def test_preprocessor_rejects_mismatched_data(tmp_path):
+    train = pd.DataFrame({
+        "Area": [1.0, 2.0],
+        "ConvexArea": [3.0, 4.0],
+        "Class": ["A", "B"]
+    })
+    data_path = tmp_path / "train.csv"
+    train.to_csv(data_path, index=False)
+    preprocessor_path = tmp_path / "preprocessor.pkl"
+    save_preprocessor(fit_scaler(train), preprocessor_path, file_hash(data_path))
+
+    train.assign(Area=[1.0, 5.0]).to_csv(data_path, index=False)
+
+    with pytest.raises(ValueError):
+        load_preprocessor(preprocessor_path, data_path=data_path)
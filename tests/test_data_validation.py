@@ -20,6 +20,10 @@ from src.data_validation import (
     validate_duplicates,
     validate_high_correlation,
     validate_target_correlation,
+    fast_validate_data_types,
+    fast_validate_missing_values,
+    fast_validate_duplicates,
+    DATA_TYPES_SCHEMA,
     EXPECTED_COLS
 )
 
@@ -56,6 +60,41 @@ def test_validate_missing_values():
     df["Class"] = ["Kecimen"] * (size//2) + ["Besni"] * (size//2)
     assert validate_missing_values(df)
 
+def test_validate_missing_values_too_many():
+    size = 20
+    df = pd.DataFrame({col: [0.1]*(size-2) + [None]*2 for col in EXPECTED_COLS[:-1]})
+    df["Class"] = ["Kecimen"] * (size//2) + ["Besni"] * (size//2)
+    assert not fast_validate_missing_values(df)
+    errors = []
+    assert not validate_missing_values(df, errors=errors)
+    assert "missing values" in errors[0]
+
+def test_validate_missing_values_unknown_class():
+    df = pd.DataFrame({col: [0.1, 0.2] for col in EXPECTED_COLS[:-1]})
+    df["Class"] = ["Kecimen", "Sultana"]
+    assert not fast_validate_missing_values(df)
+    assert not validate_missing_values(df)
+
+def test_fast_path_skips_pandera(monkeypatch):
+    df = pd.DataFrame({col: [0.1, 0.2] for col in EXPECTED_COLS[:-1]})
+    df["Class"] = ["Kecimen", "Besni"]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("pandera should only run when a fast check fails")
+
+    monkeypatch.setattr(DATA_TYPES_SCHEMA, "validate", fail)
+    assert fast_validate_data_types(df)
+    assert validate_data_types(df)
+
+def test_validate_data_types_diagnostics():
+    df = pd.DataFrame({col: [0.1] for col in EXPECTED_COLS[:-1]})
+    df["Class"] = ["Kecimen"]
+    df["Area"] = ["not_a_float"]
+    errors = []
+    assert not fast_validate_data_types(df)
+    assert not validate_data_types(df, errors=errors)
+    assert "Area" in errors[0]
+
 def test_validate_duplicates():
     row = {col: 0.123 for col in EXPECTED_COLS[:-1]}
     row["Class"] = "Kecimen"
@@ -63,6 +102,7 @@ def test_validate_duplicates():
     assert not validate_duplicates(df)
     df = pd.DataFrame([row, {**row, "Area": 0.456}])  # no duplicates
     assert validate_duplicates(df)
+    assert fast_validate_duplicates(df)
 
 def test_validate_high_correlation():
     # Create a df where feature_1 and feature_2 are highly correlated
@@ -0,0 +1,94 @@
+"""
+Test cases for the drift monitoring sketches in src/drift_monitoring.py.
+
+Usage: pytest test_drift_monitoring.py
+"""
+
+import os
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+from click.testing import CliRunner
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data_validation import EXPECTED_COLS
+from src.data_cleaning import fit_scaler, scale_features, path_hash, save_preprocessor
+from src.drift_monitoring import fit_reference, summarize, merge_sketches, drift_report, save_sketch, load_sketch
+from scripts.monitor_drift import main
+
+rng = np.random.default_rng(123)
+TRAIN_DF = pd.DataFrame({col: rng.normal(size=400) for col in EXPECTED_COLS[:-1]})
+TRAIN_DF["Class"] = ["Kecimen", "Besni"] * 200
+
+
+def test_merged_chunks_match_single_pass():
+    ref = fit_reference(TRAIN_DF)
+    whole = summarize(TRAIN_DF, ref["edges"])
+    merged = merge_sketches(*(summarize(TRAIN_DF.iloc[i:i + 70], ref["edges"]) for i in range(0, 400, 70)))
+
+    assert merged["class_counts"] == whole["class_counts"]
+    for group in whole["groups"]:
+        for feature, summary in whole["groups"][group].items():
+            assert merged["groups"][group][feature]["bins"] == summary["bins"]
+            assert merged["groups"][group][feature]["mean"] == pytest.approx(summary["mean"])
+            assert merged["groups"][group][feature]["m2"] == pytest.approx(summary["m2"])
+
+
+def test_drift_report_flags_shifted_feature():
+    ref = fit_reference(TRAIN_DF)
+    shifted = TRAIN_DF.assign(Area=TRAIN_DF["Area"] + 2)
+    report = drift_report(ref, summarize(shifted, ref["edges"]))
+    overall = report[report["group"] == "__all__"].set_index("feature")
+
+    assert overall.loc["Area", "psi"] > 1
+    assert overall.loc["Area", "mean_shift"] > 1
+    assert overall.loc["Perimeter", "psi"] == pytest.approx(0)
+    assert overall.loc["Class", "psi"] == pytest.approx(0)
+
+
+def test_drift_report_without_class_column():
+    ref = fit_reference(TRAIN_DF)
+    report = drift_report(ref, summarize(TRAIN_DF.drop(columns=["Class"]), ref["edges"]))
+    assert set(report["group"]) == {"__all__"}
+
+
+def test_merge_rejects_different_edges():
+    with pytest.raises(ValueError):
+        merge_sketches(fit_reference(TRAIN_DF), fit_reference(TRAIN_DF, n_bins=5))
+
+
+def test_sketch_round_trip(tmp_path):
+    ref = fit_reference(TRAIN_DF)
+    path = tmp_path / "sketch.json"
+    save_sketch(ref, path)
+    loaded = load_sketch(path)
+    report = drift_report(loaded, summarize(TRAIN_DF, loaded["edges"]))
+    assert report["psi"].max() == pytest.approx(0)
+
+
+def test_check_requires_the_reference_space(tmp_path):
+    raw = TRAIN_DF.assign(**{col: TRAIN_DF[col] * 10 + 50 for col in EXPECTED_COLS[:-1]})
+    scaler = fit_scaler(raw)
+    scaled, _ = scale_features(raw, raw, scaler=scaler)
+    train_path, batch_path = tmp_path / "train.csv", tmp_path / "batch.csv"
+    scaled.to_csv(train_path, index=False)
+    raw.to_csv(batch_path, index=False)
+    preprocessor_path = tmp_path / "preprocessor.pkl"
+    save_preprocessor(scaler, preprocessor_path, path_hash(train_path))
+    sketch_path = tmp_path / "sketch.json"
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["reference", str(train_path), str(sketch_path), "--preprocessor", str(preprocessor_path)])
+    assert result.exit_code == 0, result.output
+    assert load_sketch(sketch_path)["preprocessor_hash"] == path_hash(train_path)
+
+    # Raw batches against a scaled reference would all look drifted
+    result = runner.invoke(main, ["check", str(sketch_path), str(batch_path)])
+    assert result.exit_code != 0
+    assert "scaled features" in result.output
+
+    result = runner.invoke(main, ["check", str(sketch_path), str(batch_path), "--preprocessor", str(preprocessor_path)])
+    assert result.exit_code == 0, result.output
+    assert "No drift detected" in result.output
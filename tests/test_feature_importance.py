@@ -0,0 +1,49 @@
+"""
+Test cases for parallel permutation importance in src/feature_importance.py.
+
+Usage: pytest test_feature_importance.py
+"""
+
+import os
+import sys
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression
+from sklearn.svm import LinearSVC
+from sklearn.inspection import permutation_importance as sklearn_permutation_importance
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.feature_importance import permutation_importance
+
+rng = np.random.default_rng(123)
+X = rng.normal(size=(200, 3))
+y = np.where(X[:, 0] + 0.3 * X[:, 1] > 0, "Kecimen", "Besni")
+NAMES = ["signal", "weak", "noise"]
+
+
+@pytest.mark.parametrize("clf", [LogisticRegression(), LinearSVC()])
+def test_permutation_importance_ranks_features(clf):
+    clf.fit(X[:100], y[:100])
+    result = permutation_importance(clf, X[100:], y[100:], NAMES, n_repeats=20, n_jobs=2)
+
+    assert list(result.columns) == ["feature", "importance", "std", "seconds"]
+    assert result["feature"].tolist()[0] == "signal"
+    assert abs(result.set_index("feature").loc["noise", "importance"]) < 0.05
+    assert (result["std"] >= 0).all()
+
+
+def test_permutation_importance_matches_sklearn():
+    clf = LogisticRegression().fit(X[:100], y[:100])
+    ours = permutation_importance(clf, X[100:], y[100:], NAMES, n_repeats=50).set_index("feature")
+    theirs = sklearn_permutation_importance(clf, X[100:], y[100:], n_repeats=50, random_state=0)
+    np.testing.assert_allclose(ours.loc[NAMES, "importance"], theirs.importances_mean, atol=0.03)
+
+
+def test_permutation_importance_splits_repeats_across_workers():
+    clf = LogisticRegression().fit(X[:100], y[:100])
+    # More workers than features, so each feature's repeats are split into chunks
+    result = permutation_importance(clf, X[100:], y[100:], NAMES, n_repeats=7, n_jobs=8).set_index("feature")
+    single = permutation_importance(clf, X[100:], y[100:], NAMES, n_repeats=7, n_jobs=1).set_index("feature")
+    assert result.loc["signal", "importance"] > 0.1
+    assert abs(result.loc["signal", "importance"] - single.loc["signal", "importance"]) < 0.1
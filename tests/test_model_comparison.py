@@ -0,0 +1,57 @@
+"""
+Test cases for the parallel model comparison in src/model_comparison.py.
+
+Usage: pytest test_model_comparison.py
+"""
+
+import json
+import os
+import sys
+import numpy as np
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.model_comparison import compare_estimators, select_winner, update_registry
+
+rng = np.random.default_rng(123)
+X = rng.normal(size=(60, 3))
+y = np.where(X[:, 0] > 0, "Kecimen", "Besni")
+
+
+def test_compare_estimators():
+    results = compare_estimators(X[:40], y[:40], X[40:], y[40:],
+                                 ["logistic_regression", "linear_svm"], n_jobs=2)
+    assert [r["estimator"] for r in results] == ["logistic_regression", "linear_svm"]
+    for r in results:
+        assert 0 <= r["accuracy"] <= 1
+        assert r["model_size_bytes"] > 0
+        assert r["predict_ms_per_1k"] > 0
+        assert r["model"].predict(X[:1]).shape == (1,)
+
+
+def test_compare_estimators_unknown_name():
+    with pytest.raises(ValueError):
+        compare_estimators(X, y, X, y, ["not_a_model"])
+
+
+def test_select_winner_respects_latency_budget():
+    results = [
+        {"estimator": "fast", "accuracy": 0.8, "predict_ms_per_1k": 1.0},
+        {"estimator": "slow", "accuracy": 0.9, "predict_ms_per_1k": 50.0},
+    ]
+    assert select_winner(results)["estimator"] == "slow"
+    assert select_winner(results, latency_budget_ms=10)["estimator"] == "fast"
+    with pytest.raises(ValueError):
+        select_winner(results, latency_budget_ms=0.5)
+
+
+def test_update_registry_appends_runs(tmp_path):
+    registry = tmp_path / "registry.json"
+    results = [{"estimator": "fast", "accuracy": 0.8, "predict_ms_per_1k": 1.0, "model": object()}]
+    update_registry(registry, results, results[0])
+    update_registry(registry, results, results[0], latency_budget_ms=5)
+    runs = json.loads(registry.read_text())
+    assert len(runs) == 2
+    assert runs[1]["winner"] == "fast"
+    assert "model" not in runs[1]["models"][0]
@@ -0,0 +1,85 @@
+"""
+Test cases for the partitioned dataset layout in src/partitioning.py.
+
+Usage: pytest test_partitioning.py
+"""
+
+import os
+import sys
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.partitioning import parse_filter, load_manifest, prune_partitions, read_partitioned, write_partitioned
+
+DF = pd.DataFrame({
+    "Area": [10.0, 20.0, 30.0, 40.0],
+    "Perimeter": [1.0, 2.0, 3.0, 4.0],
+    "Class": ["Kecimen", "Besni", "Kecimen", "Besni"]
+})
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    root = str(tmp_path / "data")
+    write_partitioned(DF.iloc[:2], root, "2024-01-01")
+    write_partitioned(DF.iloc[2:], root, "2024-02-01")
+    return root
+
+
+def test_parse_filter():
+    assert parse_filter("Area<=90000") == ("Area", "<=", 90000.0)
+    assert parse_filter("ingest_date >= 2024-01-01") == ("ingest_date", ">=", "2024-01-01")
+    assert parse_filter("Class==Besni") == ("Class", "==", "Besni")
+    with pytest.raises(ValueError):
+        parse_filter("Area")
+    with pytest.raises(ValueError, match="Invalid filter expression"):
+        parse_filter("Area<abc")
+
+
+def test_manifest_stats(dataset):
+    manifest = load_manifest(dataset)
+    assert len(manifest["partitions"]) == 4
+    partition = manifest["partitions"][0]
+    assert partition["values"] == {"ingest_date": "2024-01-01", "Class": "Besni"}
+    assert partition["stats"]["Area"] == {"min": 20.0, "max": 20.0}
+
+
+def test_rewriting_a_partition_replaces_it(dataset):
+    write_partitioned(DF.iloc[:1].assign(Area=99.0), dataset, "2024-01-01")
+    df = read_partitioned(dataset, ["ingest_date==2024-01-01", "Class==Kecimen"])
+    assert df["Area"].tolist() == [99.0]
+
+
+def test_prune_partitions(dataset):
+    manifest = load_manifest(dataset)
+    assert len(prune_partitions(manifest, [parse_filter("ingest_date>=2024-02-01")])) == 2
+    assert len(prune_partitions(manifest, [parse_filter("Area>35")])) == 1
+    assert prune_partitions(manifest, [parse_filter("Area>50")]) == []
+
+
+def test_read_partitioned_filters_and_columns(dataset):
+    df = read_partitioned(dataset, ["ingest_date>=2024-02-01", "Area<35"], columns=["Area", "Class"])
+    assert list(df.columns) == ["Area", "Class"]
+    assert df.to_dict("records") == [{"Area": 30.0, "Class": "Kecimen"}]
+
+    assert len(read_partitioned(dataset)) == 4
+    assert read_partitioned(dataset, ["Area>50"], columns=["Area"]).empty
+
+
+def test_read_partitioned_unknown_column(dataset):
+    with pytest.raises(ValueError):
+        read_partitioned(dataset, ["Color==red"])
+
+
+def test_scaled_dataset_rejects_feature_filters(tmp_path):
+    root = str(tmp_path / "scaled")
+    write_partitioned(DF, root, "2024-01-01", scaled=True)
+    assert load_manifest(root)["scaled"] is True
+    assert len(read_partitioned(root, ["Class==Besni"])) == 2
+    # Raw thresholds mean nothing against standardized values
+    with pytest.raises(ValueError, match="scaled features"):
+        read_partitioned(root, ["Area<90000"])
+    with pytest.raises(ValueError, match="mix raw and scaled"):
+        write_partitioned(DF, root, "2024-02-01")
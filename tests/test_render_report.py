@@ -0,0 +1,92 @@
+"""
+Test cases for the report build in scripts/render_report.py. A stand-in
+quarto executable records each call, so no real rendering happens.
+
+Usage: pytest test_render_report.py
+"""
+
+import os
+import sys
+import stat
+import pytest
+from click.testing import CliRunner
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from scripts.render_report import main
+
+FAKE_QUARTO = """#!/bin/sh
+# Fail if another render is using the same input, as quarto's shared files would
+lock="$2.lock"
+[ -e "$lock" ] && exit 3
+touch "$lock"
+[ -f "$2" ] || exit 4
+echo "$@" >> "{log}"
+sleep 0.3
+rm "$lock"
+"""
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    log = tmp_path / "calls.log"
+    quarto = bin_dir / "quarto"
+    quarto.write_text(FAKE_QUARTO.format(log=log))
+    quarto.chmod(quarto.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    (tmp_path / "analysis").mkdir()
+    qmd = tmp_path / "analysis" / "report.qmd"
+    qmd.write_text("# Report\n")
+    results = tmp_path / "results"
+    results.mkdir()
+    (results / "table.csv").write_text("a\n1\n")
+    return qmd, results, log
+
+
+def run(qmd, results):
+    return CliRunner().invoke(main, [str(qmd), "--results-dir", str(results)])
+
+
+def test_formats_render_from_separate_copies(project):
+    qmd, results, log = project
+    result = run(qmd, results)
+    assert result.exit_code == 0, result.output
+
+    # Results changed: every format refreshes its own cache entries
+    assert sorted(log.read_text().splitlines()) == [
+        f"render {qmd.with_name('report.render-html.qmd')} --to html --cache-refresh",
+        f"render {qmd.with_name('report.render-pdf.qmd')} --to pdf --cache-refresh",
+    ]
+    assert sorted(p.name for p in qmd.parent.iterdir()) == [".report.results.sha256", "report.qmd"]
+
+
+def test_unchanged_results_render_in_parallel_without_refresh(project):
+    qmd, results, log = project
+    run(qmd, results)
+    log.write_text("")
+
+    result = run(qmd, results)
+    assert result.exit_code == 0, result.output
+    assert "Results unchanged" in result.output
+    assert sorted(log.read_text().splitlines()) == [
+        f"render {qmd.with_name('report.render-html.qmd')} --to html",
+        f"render {qmd.with_name('report.render-pdf.qmd')} --to pdf",
+    ]
+
+    (results / "table.csv").write_text("a\n2\n")
+    log.write_text("")
+    run(qmd, results)
+    assert all(call.endswith("--cache-refresh") for call in log.read_text().splitlines())
+
+
+def test_failed_render_does_not_write_stamp(project):
+    qmd, results, log = project
+    # A leftover lock makes the fake quarto fail the pdf render
+    qmd.with_name("report.render-pdf.qmd.lock").write_text("")
+    result = run(qmd, results)
+    assert result.exit_code != 0
+    assert "failed for: pdf" in result.output
+    assert not qmd.with_name(".report.results.sha256").exists()
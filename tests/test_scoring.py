@@ -0,0 +1,107 @@
+"""
+Test cases for watch-mode scoring in src/scoring.py.
+
+Usage: pytest test_scoring.py
+"""
+
+import json
+import os
+import pickle
+import sys
+import threading
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import StandardScaler
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data_validation import EXPECTED_COLS
+from src.scoring import load_model, prepare_batch, score_batch, watch, latency_summary
+
+rng = np.random.default_rng(123)
+RAW_DF = pd.DataFrame({col: rng.uniform(1, 100, size=40) for col in EXPECTED_COLS[:-1]})
+RAW_DF["Class"] = np.where(RAW_DF["Area"] > 50, "Kecimen", "Besni")
+FEATURES = EXPECTED_COLS[:-1]
+
+
+@pytest.fixture
+def bundle():
+    scaler = StandardScaler().fit(RAW_DF[FEATURES])
+    model = LogisticRegression().fit(scaler.transform(RAW_DF[FEATURES]), RAW_DF["Class"])
+    return {"model": model, "scaler": scaler, "features": FEATURES, "scaler_input": "raw"}
+
+
+def test_load_model_rejects_models_without_raw_scaler(bundle, tmp_path):
+    path = tmp_path / "model.pkl"
+    with open(path, "wb") as f:
+        pickle.dump(bundle, f)
+    assert load_model(path)["features"] == FEATURES
+
+    for stale in ({**bundle, "scaler_input": "train_data"},
+                  {"model": bundle["model"], "scaler": bundle["scaler"]}):
+        with open(path, "wb") as f:
+            pickle.dump(stale, f)
+        with pytest.raises(ValueError, match="--preprocessor"):
+            load_model(path)
+
+
+def test_prepare_batch_unlabeled():
+    df = prepare_batch(RAW_DF.drop(columns=["Class"]))
+    assert "Class" not in df.columns
+    with pytest.raises(ValueError):
+        prepare_batch(RAW_DF.assign(Class="Sultana"))
+
+
+def test_score_batch(bundle):
+    scored = score_batch(bundle, prepare_batch(RAW_DF))
+    assert (scored["prediction"] == scored["Class"]).mean() > 0.9
+    assert scored["probability"].between(0.5, 1).all()
+
+
+def test_watch_scores_each_file_once(bundle, tmp_path):
+    input_dir, output_dir = tmp_path / "in", tmp_path / "out"
+    input_dir.mkdir()
+    for i in range(4):
+        RAW_DF.iloc[i * 10:(i + 1) * 10].drop(columns=["Class"]).to_csv(input_dir / f"lot{i}.csv", index=False)
+    RAW_DF.drop(columns=["Area"]).to_csv(input_dir / "broken.csv", index=False)
+    ledger = str(output_dir / "ledger.jsonl")
+
+    # A queue of one forces the producer to wait on the consumer
+    records = watch(str(input_dir), str(output_dir), bundle, ledger,
+                    queue_size=1, settle_seconds=0, poll_interval=0.01, once=True)
+
+    assert sorted(r["status"] for r in records) == ["failed"] + ["scored"] * 4
+    assert len(pd.read_csv(output_dir / "lot2_predictions.csv")) == 10
+    with open(ledger) as f:
+        assert len([json.loads(line) for line in f]) == 5
+    assert latency_summary(records)["files"] == 4
+
+    # Files already in the ledger are not scored again
+    assert watch(str(input_dir), str(output_dir), bundle, ledger,
+                 settle_seconds=0, poll_interval=0.01, once=True) == []
+
+
+def test_watch_survives_file_removed_after_queueing(bundle, tmp_path):
+    input_dir, output_dir = tmp_path / "in", tmp_path / "out"
+    input_dir.mkdir()
+    for i in range(4):
+        RAW_DF.iloc[i * 10:(i + 1) * 10].drop(columns=["Class"]).to_csv(input_dir / f"lot{i}.csv", index=False)
+
+    def remove_next(record):
+        # lot1 is already waiting on the queue while lot0 is scored
+        if record["file"].endswith("lot0.csv"):
+            os.remove(input_dir / "lot1.csv")
+
+    result = []
+    thread = threading.Thread(target=lambda: result.extend(watch(
+        str(input_dir), str(output_dir), bundle, str(output_dir / "ledger.jsonl"),
+        queue_size=1, workers=1, settle_seconds=0, poll_interval=0.01, once=True,
+        on_record=remove_next)))
+    thread.start()
+    thread.join(timeout=30)
+
+    assert not thread.is_alive()
+    statuses = {os.path.basename(r["file"]): r["status"] for r in result}
+    assert statuses == {"lot0.csv": "scored", "lot1.csv": "failed", "lot2.csv": "scored", "lot3.csv": "scored"}
@@ -0,0 +1,72 @@
+"""
+Test cases for multi-file validation in src/sharded_validation.py.
+
+Usage: pytest test_sharded_validation.py
+"""
+
+import os
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data_validation import EXPECTED_COLS, validate_high_correlation, validate_target_correlation
+from src.sharded_validation import CORR_COLS, correlation_partial, merge_correlation_partials, validate_files
+
+rng = np.random.default_rng(123)
+DF = pd.DataFrame({col: rng.normal(size=90) for col in EXPECTED_COLS[:-1]})
+DF["ConvexArea"] = DF["Area"] * 1.01 + rng.normal(scale=0.01, size=90)
+DF["Class"] = np.where(DF["Area"] > 0, "Kecimen", "Besni")
+
+
+def test_merged_correlation_matches_full_data():
+    partials = [correlation_partial(DF.iloc[i:i + 30]) for i in range(0, 90, 30)]
+    merged = merge_correlation_partials(partials)
+
+    encoded = DF.copy()
+    encoded["Class"] = encoded["Class"].astype("category").cat.codes
+    expected = encoded[CORR_COLS].corr()
+    np.testing.assert_allclose(merged.to_numpy(), expected.to_numpy(), atol=1e-10)
+
+
+def test_validate_files(tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"lot{i}.csv"
+        # Each shard repeats the last two rows of the previous one
+        DF.iloc[max(i * 30 - 2, 0):(i + 1) * 30].to_csv(path, index=False)
+        paths.append(str(path))
+    bad_path = tmp_path / "bad.csv"
+    DF.drop(columns=["Extent"]).to_csv(bad_path, index=False)
+    paths.append(str(bad_path))
+    malformed_path = tmp_path / "malformed.csv"
+    malformed_path.write_text('Area,Class\n1.0,"Kecimen\n')
+    paths.append(str(malformed_path))
+    mislabelled_path = tmp_path / "mislabelled.csv"
+    DF.iloc[:30].assign(Class="Sultana", Area=100.0).to_csv(mislabelled_path, index=False)
+    paths.append(str(mislabelled_path))
+
+    report = validate_files(paths, n_jobs=2)
+
+    assert report["files_failed"] == 3
+    assert report["files"][3]["failures"] == ["columns"]
+    assert report["files"][4]["failures"] == ["unreadable"]
+    assert "ParserError" in report["files"][4]["errors"][0]
+    assert report["files"][5]["failures"] == ["missing values"]
+    assert report["cross_file_duplicates"] == 4
+    assert report["high_correlation"] == validate_high_correlation(DF)
+    assert report["target_correlation"] == validate_target_correlation(DF)
+
+
+def test_correlation_partial_skips_unknown_labels():
+    labelled = correlation_partial(DF)
+    with_unknown = correlation_partial(pd.concat([DF, DF.iloc[:5].assign(Class="Sultana")]))
+    assert with_unknown["n"] == labelled["n"]
+    np.testing.assert_allclose(with_unknown["cross"], labelled["cross"])
+
+
+def test_validate_files_requires_input():
+    with pytest.raises(ValueError):
+        validate_files([])